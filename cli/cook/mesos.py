@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 from urllib.parse import urlparse, parse_qs
@@ -63,25 +64,42 @@ def retrieve_instance_sandbox_directory(instance, job):
     return directories[0]
 
 
-def read_file(instance, sandbox_dir, path, offset=None, length=None):
-    """Calls the Mesos agent files/read API for the given path, offset, and length"""
-    logging.info(f'reading file from sandbox {sandbox_dir} with path {path} at offset {offset} and length {length}')
-    agent_url = instance_to_agent_url(instance)
-    params = {'path': os.path.join(sandbox_dir, path)}
-    if offset is not None:
-        params['offset'] = offset
-    if length is not None:
-        params['length'] = length
+def file_reader(instance, sandbox_dir, path):
+    """
+    Returns a function that calls the Mesos agent files/read API for the given path with an optional
+    offset and length; the agent URL and sandbox path are resolved once, up front, rather than per read
+    """
+    url = f'{instance_to_agent_url(instance)}/files/read'
+    full_path = os.path.join(sandbox_dir, path)
 
-    resp = http.__get(f'{agent_url}/files/read', params=params)
-    if resp.status_code == 404:
-        raise CookRetriableException(f"Cannot open '{path}' for reading (file was not found).")
+    def read(offset=None, length=None):
+        # This runs on every read, so let logging format the message only if it is going to be emitted
+        logging.info('reading file from sandbox %s with path %s at offset %s and length %s',
+                     sandbox_dir, path, offset, length)
+        params = {'path': full_path}
+        if offset is not None:
+            params['offset'] = offset
+        if length is not None:
+            params['length'] = length
 
-    if resp.status_code != 200:
-        logging.error(f'mesos agent returned status code {resp.status_code} and body {resp.text}')
-        raise CookRetriableException('Could not read the file.')
+        resp = http.__get(url, params=params)
+        if resp.status_code == 404:
+            raise CookRetriableException(f"Cannot open '{path}' for reading (file was not found).")
 
-    return resp.json()
+        if resp.status_code != 200:
+            logging.error('mesos agent returned status code %s and body %s', resp.status_code, resp.text)
+            raise CookRetriableException('Could not read the file.')
+
+        # Parse the raw body directly; json.loads detects the UTF encoding of bytes itself,
+        # so we skip requests' own decoding of the entire body into a str first
+        return json.loads(resp.content)
+
+    return read
+
+
+def read_file(instance, sandbox_dir, path, offset=None, length=None):
+    """Calls the Mesos agent files/read API for the given path, offset, and length"""
+    return file_reader(instance, sandbox_dir, path)(offset=offset, length=length)
 
 
 def download_file(instance, sandbox_dir, path):
@@ -1,108 +1,165 @@
+import logging
+import math
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 from cook import plugins
-from cook.mesos import read_file
+from cook.mesos import file_reader, read_file
 from cook.querying import query_unique_and_run, parse_entity_refs
 from cook.util import check_positive, guard_no_cluster
 
-CHUNK_SIZE = 4096
+# The Mesos agent caps files/read responses at 16 pages, so asking
+# for more than this would silently return a truncated chunk
+CHUNK_SIZE = 65536
 LINE_DELIMITER = '\n'
 DEFAULT_NUM_LINES = 10
 DEFAULT_FOLLOW_SLEEP_SECS = 1.0
+# With -f, the sleep between reads never drops below this fraction of the user's sleep interval
+MIN_FOLLOW_SLEEP_FRACTION = 0.25
+MAX_PARALLEL_READS = 4
+# Rough guess at the average line length, used to size the first batch of reads
+ESTIMATED_LINE_BYTES = 256
+# Upper bound on how much of the file tail_backwards will hold in memory; if the requested
+# lines span more than this, only the last MAX_BUFFERED_CHARS characters are printed
+MAX_BUFFERED_CHARS = 64 * 1024 * 1024
 DEFAULT_PATH = 'stdout'
 
 
-# For everything we print in tail, we want to forcibly flush
-# the stream, and we don't want to end with a newline
-__print = partial(print, flush=True, end='')
+def write_chunks(chunks):
+    """Writes the given chunks, which were read from the end of the file backwards, to stdout in file order"""
+    out = sys.stdout
+    for chunk in reversed(chunks):
+        out.write(chunk)
 
 
-def print_lines(lines):
-    """Prints the given list of lines, delimited, and with no trailing newline"""
-    __print(LINE_DELIMITER.join(lines))
-
-
-def check_enough_lines_read(line_buffer, num_lines_to_print):
-    """If enough lines have been read to satisfy the user's request, prints those lines"""
-    num_lines_buffered = len(line_buffer)
-    if num_lines_buffered > 0:
-        # If the last line is empty, don't count it as a line that we care about
-        last_line_empty = line_buffer[-1] == ''
-        num_lines_printable = num_lines_buffered - (1 if last_line_empty else 0)
-        if num_lines_printable >= num_lines_to_print:
-            if last_line_empty:
-                num_lines_to_print = num_lines_to_print + 1
-            print_lines(line_buffer[-num_lines_to_print:])
-            return True
-    return False
-
-
-def check_start_of_file(offset, partial_line_buffer, line_buffer):
-    """If we have reached the start of the file, prints what we have read"""
-    if offset == 0:
-        __print(partial_line_buffer)
-        num_lines_buffered = len(line_buffer)
-        if num_lines_buffered > 0:
-            __print('\n')
-            print_lines(line_buffer)
-        return True
-    return False
+def find_nth_last_delimiter(data, n, num_delimiters):
+    """
+    Returns the index of the nth-from-last line delimiter in data, which contains num_delimiters
+    (at least n) of them; the search starts from whichever end of data is closer to that delimiter
+    """
+    if n <= num_delimiters - n:
+        index = len(data)
+        for _ in range(n):
+            index = data.rfind(LINE_DELIMITER, 0, index)
+    else:
+        index = -1
+        for _ in range(num_delimiters - n + 1):
+            index = data.find(LINE_DELIMITER, index + 1)
+    return index
+
+
+def read_backwards(file_size, read_fn, num_chunks_in_first_batch=1):
+    """
+    Generates (offset, data) pairs for consecutive chunks of the file, starting at
+    the end and moving towards the beginning. The first num_chunks_in_first_batch
+    chunks are read together; after that, chunks are read MAX_PARALLEL_READS at a time
+    """
+    end = file_size
+    num_chunks_in_batch = num_chunks_in_first_batch
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_READS) as executor:
+        while True:
+            ranges = []
+            while len(ranges) < num_chunks_in_batch:
+                offset = max(end - CHUNK_SIZE, 0)
+                ranges.append((offset, end - offset))
+                end = offset
+                if offset == 0:
+                    break
+
+            if len(ranges) == 1:
+                offset, length = ranges[0]
+                responses = [read_fn(offset=offset, length=length)]
+            else:
+                responses = executor.map(lambda r: read_fn(offset=r[0], length=r[1]), ranges)
+
+            for (offset, _), resp in zip(ranges, responses):
+                yield offset, resp['data']
+
+            if end == 0:
+                break
+            num_chunks_in_batch = MAX_PARALLEL_READS
 
 
 def tail_backwards(file_size, read_fn, num_lines_to_print):
     """
-    Reads chunks backwards from the end of the file and splits them into
-    lines as it goes. If it finds that enough lines have been read to satisfy
-    the user's request, or if it reaches the beginning of the file, it stops
+    Reads chunks backwards from the end of the file, counting the line delimiters
+    in each one as it goes. Once enough delimiters have been seen to satisfy the
+    user's request, or once it reaches the beginning of the file, it prints the
+    requested lines and stops
     """
-    offset = max(file_size - CHUNK_SIZE, 0)
-    length = file_size - offset
-    partial_line_buffer = ''
-    line_buffer = []
-
-    while True:
-        # Read the data at offset and length
-        resp = read_fn(offset=offset, length=length)
-        data = resp['data']
-
-        # Add to our buffer of text we've read from the agent
-        partial_line_buffer = data + partial_line_buffer
-
-        # Attempt to split into lines
-        lines = partial_line_buffer.split(LINE_DELIMITER)
-        if len(lines) > 1:
-            index_first_delimiter = len(lines[0])
-            partial_line_buffer = partial_line_buffer[:index_first_delimiter]
-            line_buffer = lines[1:] + line_buffer
-
-        # Check if we've read enough lines
-        if check_enough_lines_read(line_buffer, num_lines_to_print):
+    chunks = []
+    num_chars_buffered = 0
+    num_delimiters_read = 0
+    num_delimiters_needed = None
+
+    # Guess how many chunks the requested lines span so that
+    # the common case is satisfied by the first batch of reads
+    estimated_num_chunks = math.ceil(num_lines_to_print * ESTIMATED_LINE_BYTES / CHUNK_SIZE)
+    num_chunks_in_first_batch = min(max(estimated_num_chunks, 1), MAX_PARALLEL_READS)
+
+    for _, data in read_backwards(file_size, read_fn, num_chunks_in_first_batch):
+        if num_delimiters_needed is None:
+            # If the file ends with a delimiter, the empty "line" after
+            # it is not one that we care about, so we need one more
+            num_delimiters_needed = num_lines_to_print + (1 if data.endswith(LINE_DELIMITER) else 0)
+
+        # Counting is much cheaper than splitting, so we only look for the
+        # first line to print once we know it's somewhere in this chunk
+        num_delimiters_in_chunk = data.count(LINE_DELIMITER)
+        if num_delimiters_read + num_delimiters_in_chunk >= num_delimiters_needed:
+            index = find_nth_last_delimiter(data, num_delimiters_needed - num_delimiters_read,
+                                            num_delimiters_in_chunk)
+            chunks.append(data[index + 1:])
             break
 
-        # Check if we've reached the start of the file
-        if check_start_of_file(offset, partial_line_buffer, line_buffer):
+        num_delimiters_read += num_delimiters_in_chunk
+        num_chars_buffered += len(data)
+        if num_chars_buffered > MAX_BUFFERED_CHARS:
+            logging.warning('requested lines span more than %s characters, truncating', MAX_BUFFERED_CHARS)
+            chunks.append(data[num_chars_buffered - MAX_BUFFERED_CHARS:])
             break
 
-        # Update our offset and length
-        new_offset = max(offset - CHUNK_SIZE, 0)
-        length = offset - new_offset
-        offset = new_offset
+        chunks.append(data)
+
+    write_chunks(chunks)
+    sys.stdout.flush()
 
 
 def tail_follow(file_size, read_fn, follow_sleep_seconds):
-    """Follows the file as it grows, printing new contents"""
+    """
+    Follows the file as it grows, printing new contents. The time between reads
+    backs off towards follow_sleep_seconds while the file is idle and shrinks
+    again, down to MIN_FOLLOW_SLEEP_FRACTION of follow_sleep_seconds, when new
+    data shows up; if a read fills an entire chunk, the next read is issued
+    right away (before writing out the current chunk), since the file is
+    likely ahead of us
+    """
     offset = file_size
     length = CHUNK_SIZE
-    while True:
-        resp = read_fn(offset=offset, length=length)
-        data = resp['data']
-        num_chars_read = len(data)
-        if num_chars_read > 0:
-            __print(data)
-            offset = offset + num_chars_read
-
-        time.sleep(follow_sleep_seconds)
+    min_sleep_seconds = follow_sleep_seconds * MIN_FOLLOW_SLEEP_FRACTION
+    sleep_seconds = min_sleep_seconds
+    out = sys.stdout
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_read = executor.submit(read_fn, offset=offset, length=length)
+        while True:
+            data = pending_read.result()['data']
+            num_chars_read = len(data)
+            if num_chars_read >= length:
+                pending_read = executor.submit(read_fn, offset=offset + num_chars_read, length=length)
+            if num_chars_read > 0:
+                out.write(data)
+                out.flush()
+                offset = offset + num_chars_read
+                if num_chars_read >= length:
+                    continue
+                sleep_seconds = max(sleep_seconds / 2, min_sleep_seconds)
+            else:
+                sleep_seconds = min(sleep_seconds * 2, follow_sleep_seconds)
+
+            time.sleep(sleep_seconds)
+            pending_read = executor.submit(read_fn, offset=offset, length=length)
 
 
 def tail_for_instance(instance, sandbox_dir, path, num_lines_to_print, follow, follow_sleep_seconds):
@@ -111,9 +168,15 @@ def tail_for_instance(instance, sandbox_dir, path, num_lines_to_print, follow, f
     try and read more data from the file until the user terminates. This assumes files will not shrink.
     """
     retrieve_fn = plugins.get_fn('read-job-instance-file', read_file)
-    read = partial(retrieve_fn, instance=instance, sandbox_dir=sandbox_dir, path=path)
+    if retrieve_fn is read_file:
+        read = file_reader(instance, sandbox_dir, path)
+    else:
+        def read(offset=None, length=None):
+            return retrieve_fn(instance=instance, sandbox_dir=sandbox_dir, path=path, offset=offset, length=length)
     file_size = read()['offset']
-    tail_backwards(file_size, read, num_lines_to_print)
+    # There's nothing to read backwards from an empty file
+    if file_size > 0 and num_lines_to_print > 0:
+        tail_backwards(file_size, read, num_lines_to_print)
     if follow:
         tail_follow(file_size, read, follow_sleep_seconds)
 
@@ -144,7 +207,8 @@ def register(add_parser, add_defaults):
                         metavar='NUM', type=check_positive)
     parser.add_argument('--follow', '-f', help='output appended data as the file grows', action='store_true')
     parser.add_argument('--sleep-interval', '-s',
-                        help=f'with -f, sleep for N seconds (default {DEFAULT_FOLLOW_SLEEP_SECS}) between iterations',
+                        help=f'with -f, sleep for at most N seconds (default {DEFAULT_FOLLOW_SLEEP_SECS}) between '
+                             f'iterations, and at least {MIN_FOLLOW_SLEEP_FRACTION:g}*N seconds while the file grows',
                         metavar='N', type=float)
     parser.add_argument('--wait', '-w',
                         help='wait indefinitely for the job to be running and for the file to become available',
@@ -0,0 +1,97 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from nose.plugins.attrib import attr
+
+from cook.subcommands import tail
+from cook.subcommands.tail import find_nth_last_delimiter, read_backwards, tail_backwards, tail_follow
+
+
+def make_read_fn(contents):
+    """Returns a read function that serves the given contents like the Mesos files/read API"""
+
+    def read(offset=None, length=None):
+        if offset is None:
+            return {'data': '', 'offset': len(contents)}
+        return {'data': contents[offset:offset + length], 'offset': offset}
+
+    return read
+
+
+@attr(cli=True)
+class CookCliTailTest(unittest.TestCase):
+    _multiprocess_can_split_ = True
+
+    def tail_backwards(self, contents, num_lines_to_print):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            tail_backwards(len(contents), make_read_fn(contents), num_lines_to_print)
+        return out.getvalue()
+
+    def test_tail_backwards_reads_across_chunks(self):
+        contents = ''.join(f'{i}\n' for i in range(1, 101))
+        with patch.object(tail, 'CHUNK_SIZE', 7):
+            self.assertEqual('100\n', self.tail_backwards(contents, 1))
+            self.assertEqual(''.join(f'{i}\n' for i in range(91, 101)), self.tail_backwards(contents, 10))
+            self.assertEqual(contents, self.tail_backwards(contents, 100))
+            self.assertEqual(contents, self.tail_backwards(contents, 1000))
+
+    def test_tail_backwards_no_trailing_newline(self):
+        contents = 'Hello\nworld!'
+        with patch.object(tail, 'CHUNK_SIZE', 3):
+            self.assertEqual('world!', self.tail_backwards(contents, 1))
+            self.assertEqual(contents, self.tail_backwards(contents, 2))
+
+    def test_tail_backwards_no_newlines(self):
+        contents = ' '.join(str(i) for i in range(1, 101)) + ' '
+        with patch.object(tail, 'CHUNK_SIZE', 16):
+            self.assertEqual(contents, self.tail_backwards(contents, 10))
+
+    def test_tail_backwards_empty_lines(self):
+        contents = 'a\n\n\nb\n\n'
+        with patch.object(tail, 'CHUNK_SIZE', 2):
+            self.assertEqual('\n', self.tail_backwards(contents, 1))
+            self.assertEqual('b\n\n', self.tail_backwards(contents, 2))
+            self.assertEqual(contents, self.tail_backwards(contents, 5))
+
+    def test_tail_backwards_caps_buffered_chars(self):
+        contents = 'x' * 100 + '\n'
+        with patch.object(tail, 'CHUNK_SIZE', 16), patch.object(tail, 'MAX_BUFFERED_CHARS', 40):
+            self.assertEqual(contents[-40:], self.tail_backwards(contents, 1))
+            self.assertEqual(contents[-40:], self.tail_backwards(contents, 10))
+
+    def test_tail_backwards_empty_file(self):
+        self.assertEqual('', self.tail_backwards('', 10))
+
+    def test_read_backwards_covers_file_in_order(self):
+        contents = ''.join(f'{i}\n' for i in range(1, 101))
+        with patch.object(tail, 'CHUNK_SIZE', 10):
+            chunks = list(read_backwards(len(contents), make_read_fn(contents)))
+        offsets = [offset for offset, _ in chunks]
+        self.assertEqual(sorted(offsets, reverse=True), offsets)
+        self.assertEqual(0, offsets[-1])
+        self.assertEqual(contents, ''.join(data for _, data in reversed(chunks)))
+
+    def test_find_nth_last_delimiter(self):
+        data = 'a\nbb\n\nccc\nd'
+        self.assertEqual(9, find_nth_last_delimiter(data, 1, 4))
+        self.assertEqual(5, find_nth_last_delimiter(data, 2, 4))
+        self.assertEqual(4, find_nth_last_delimiter(data, 3, 4))
+        self.assertEqual(1, find_nth_last_delimiter(data, 4, 4))
+
+    def test_tail_follow_writes_through_text_stdout(self):
+        contents = 'héllo\nwörld\n'
+        reads = []
+
+        def read(offset=None, length=None):
+            reads.append(offset)
+            if len(reads) > 3:
+                raise KeyboardInterrupt()
+            return {'data': contents[offset:offset + length], 'offset': offset}
+
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(KeyboardInterrupt):
+            tail_follow(0, read, 0.01)
+        self.assertEqual(contents, out.getvalue())
@@ -4,6 +4,7 @@
 # https://docs.pytest.org/en/2.7.3/plugins.html#conftest-py-plugins
 import logging
 import os
+import signal
 import socket
 import subprocess
 import threading
@@ -49,3 +50,23 @@ if util.kerberos_enabled() and os.getenv('COOK_MAX_TEST_USERS'):
             _ssh_check(username)
     else:
         assert False, f'{switch_user_mode} is not a valid value for COOK_SWITCH_USER_MODE'
+
+
+def pytest_sessionfinish(session, exitstatus):
+    util.SHUTDOWN.set()
+
+
+def _interrupt_handler(previous_handler):
+    """Returns a SIGINT handler that stops any in-flight wait_until polling before deferring to previous_handler"""
+
+    def handler(signum, frame):
+        util.SHUTDOWN.set()
+        previous_handler(signum, frame)
+
+    return handler
+
+
+# Worker threads polling via wait_until never see the KeyboardInterrupt, and the main thread
+# blocks on them when it unwinds out of a ThreadPoolExecutor, so tell them to stop right away
+if callable(signal.getsignal(signal.SIGINT)):
+    signal.signal(signal.SIGINT, _interrupt_handler(signal.getsignal(signal.SIGINT)))
@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import json
 import logging
 import math
@@ -10,6 +11,7 @@ import time
 import unittest
 import uuid
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -24,10 +26,12 @@ from tests.cook import util
 
 @pytest.mark.timeout(util.DEFAULT_TEST_TIMEOUT_SECS)  # individual test timeout
 class CookTest(util.CookTest):
+    user = None
 
     @classmethod
     def setUpClass(cls):
         cls.cook_url = util.retrieve_cook_url()
+        cls.rawscheduler_url = f'{cls.cook_url}/rawscheduler'
         util.init_cook_session(cls.cook_url)
 
     def setUp(self):
@@ -38,7 +42,7 @@ class CookTest(util.CookTest):
 
     def test_scheduler_info(self):
         info = util.scheduler_info(self.cook_url)
-        info_details = json.dumps(info, sort_keys=True)
+        info_details = util.LazyJson(info, sort_keys=True)
         self.assertIn('authentication-scheme', info, info_details)
         self.assertIn('commit', info, info_details)
         self.assertIn('start-time', info, info_details)
@@ -55,19 +59,22 @@ class CookTest(util.CookTest):
         self.assertEqual(resp.status_code, 201, msg=resp.content)
         self.assertEqual(resp.content, str.encode(f"submitted jobs {job_uuid}"))
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
-        self.assertIn('success', [i['status'] for i in job['instances']], json.dumps(job, indent=2))
+        self.assertTrue(any(i['status'] == 'success' for i in job['instances']), util.LazyJson(job, indent=2))
         self.assertEqual(False, job['disable_mea_culpa_retries'])
         self.assertTrue(len(util.wait_for_output_url(self.cook_url, job_uuid)['output_url']) > 0)
 
         if util.should_expect_sandbox_directory_for_job(job):
-            instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-            message = json.dumps(instance, sort_keys=True)
+            # Wait for the exit code (only reported by the cook executor) together with the sandbox directory
+            fields = ['sandbox_directory']
+            if job_executor_type == 'cook':
+                fields.append('exit_code')
+            instance = util.wait_for_instance_fields(self.cook_url, job_uuid, fields)
+            message = util.LazyJson(instance, sort_keys=True)
             self.assertIsNotNone(instance['output_url'], message)
             self.assertIsNotNone(instance['sandbox_directory'], message)
 
-            if instance['executor'] == 'cook':
-                instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-                message = json.dumps(instance, sort_keys=True)
+            if job_executor_type == 'cook':
+                self.assertEqual('cook', instance['executor'], message)
                 self.assertEqual(0, instance['exit_code'], message)
             else:
                 self.logger.info(f'Exit code not checked because cook executor was not used for {instance}')
@@ -103,8 +110,9 @@ class CookTest(util.CookTest):
         self.assertEqual('HOST', docker['network'])
         self.assertEqual(False, docker['force-pull-image'])
         self.assertEqual(2, len(docker['parameters']))
-        self.assertEqual('bar', next(p['value'] for p in docker['parameters'] if p['key'] == 'foo'))
-        self.assertEqual('qux', next(p['value'] for p in docker['parameters'] if p['key'] == 'baz'))
+        parameters = {p['key']: p['value'] for p in docker['parameters']}
+        self.assertEqual('bar', parameters['foo'])
+        self.assertEqual('qux', parameters['baz'])
         self.assertEqual(4, len(volumes))
         self.assertIn({'host-path': '/var/lib/abc'}, volumes)
         self.assertIn({'mode': 'RW',
@@ -125,7 +133,7 @@ class CookTest(util.CookTest):
             pytest.skip(f'Cannot set max_retries to {retry_limit * 2}, configured maximum is {max_job_retries}')
         else:
             self.logger.debug(f'Cook executor retry limit is {retry_limit}')
-            num_hosts = len(util.get_mesos_state(self.mesos_url)['slaves'])
+            num_hosts = len(util.get_mesos_slaves(self.mesos_url)['slaves'])
             if retry_limit >= num_hosts:
                 pytest.skip(f'Skipping test as not enough agents to verify Mesos executor on subsequent '
                                   f'instances (agents = {num_hosts}, retry limit = {retry_limit})')
@@ -135,16 +143,16 @@ class CookTest(util.CookTest):
         self.assertEqual(resp.status_code, 201, msg=resp.content)
         try:
             # Try to get more than retry_limit instances
-            util.wait_until(lambda: util.load_job(self.cook_url, job_uuid),
-                            lambda job: len(job['instances']) > retry_limit)
+            job = util.wait_until(lambda: util.load_job(self.cook_url, job_uuid),
+                                  lambda job: len(job['instances']) > retry_limit)
         except BaseException as e:
             self.logger.debug(f"Didn't reach desired instance count: {e}")
+            job = util.load_job(self.cook_url, job_uuid)
 
-        job = util.load_job(self.cook_url, job_uuid)
         self.logger.debug(f"Num job instances is {len(job['instances'])}")
         job_instances = sorted(job['instances'], key=operator.itemgetter('start_time'))
         for i, job_instance in enumerate(job_instances):
-            message = f'Trailing instance {i}: {json.dumps(job_instance, sort_keys=True)}'
+            message = util.LazyJson(job_instance, f'Trailing instance {i}: ', sort_keys=True)
             self.assertNotEqual('success', job_instance['status'], message)
 
         if retry_limit >= len(job_instances):
@@ -152,7 +160,7 @@ class CookTest(util.CookTest):
         else:
             later_job_instances = job_instances[retry_limit:]
             for i, job_instance in enumerate(later_job_instances):
-                message = f'Trailing instance {i}: {json.dumps(job_instance, sort_keys=True)}'
+                message = util.LazyJson(job_instance, f'Trailing instance {i}: ', sort_keys=True)
                 self.assertEqual('mesos', job_instance['executor'], message)
 
     @unittest.skipUnless(util.is_cook_executor_in_use(), 'Test assumes the Cook Executor is in use')
@@ -165,7 +173,7 @@ class CookTest(util.CookTest):
             instance = util.wait_for_instance(self.cook_url, uuid)
             self.assertEqual('cook', instance['executor'])
             job = util.wait_for_job(self.cook_url, uuid, 'completed')
-            msg = json.dumps(job, indent=2)
+            msg = util.LazyJson(job, indent=2)
             self.assertEqual(job['state'], 'failed', msg)
             self.assertEqual(job['retries_remaining'], 0, msg)
             instances = job['instances']
@@ -186,13 +194,14 @@ class CookTest(util.CookTest):
             self.assertEqual('cook', instance['executor'])
             job = util.wait_until(lambda: util.load_job(self.cook_url, uuid),
                                   lambda job: len(job['instances']) > 1 and any(
-                                      [i['status'] == 'failed' for i in job['instances']]))
-            self.assertEqual(job['retries_remaining'], 1, json.dumps(job, indent=2))
+                                      i['status'] == 'failed' for i in job['instances']))
+            msg = util.LazyJson(job, indent=2)
+            self.assertEqual(job['retries_remaining'], 1, msg)
 
             failed_instances = [i for i in job['instances'] if i['status'] == 'failed']
-            self.assertTrue(len(failed_instances) != 0, json.dumps(job, indent=2))
+            self.assertTrue(len(failed_instances) != 0, msg)
             for instance in failed_instances:
-                msg = json.dumps(instance, indent=2)
+                msg = util.LazyJson(instance, indent=2)
                 self.assertEqual('failed', instance['status'], msg)
                 self.assertEqual('Mesos executor terminated', instance['reason_string'], msg)
                 self.assertTrue(instance['reason_mea_culpa'], msg)
@@ -200,15 +209,11 @@ class CookTest(util.CookTest):
             util.kill_jobs(self.cook_url, [uuid])
 
     def test_executor_flag(self):
-        job_uuid, resp = util.submit_job(self.cook_url, executor='cook')
+        job_uuids, resp = util.submit_jobs(self.cook_url, [{'executor': 'cook'}, {'executor': 'mesos'}])
         self.assertEqual(201, resp.status_code, msg=resp.content)
-        job = util.load_job(self.cook_url, job_uuid)
-        self.assertEqual('cook', job['executor'])
-
-        job_uuid, resp = util.submit_job(self.cook_url, executor='mesos')
-        self.assertEqual(201, resp.status_code, msg=resp.content)
-        job = util.load_job(self.cook_url, job_uuid)
-        self.assertEqual('mesos', job['executor'])
+        cook_job, mesos_job = util.load_jobs(self.cook_url, job_uuids)
+        self.assertEqual('cook', cook_job['executor'])
+        self.assertEqual('mesos', mesos_job['executor'])
 
     def test_job_environment_cook_job_and_instance_uuid_only(self):
         command = 'echo "Job environment:" && env && echo "Checking environment variables..." && ' \
@@ -222,7 +227,7 @@ class CookTest(util.CookTest):
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
         self.assertEqual(1, len(job['instances']))
-        message = json.dumps(job['instances'][0], sort_keys=True)
+        message = util.LazyJson(job['instances'][0], sort_keys=True)
         self.assertEqual('success', job['instances'][0]['status'], message)
 
     def test_job_environment_cook_job_and_instance_and_group_uuid(self):
@@ -238,7 +243,7 @@ class CookTest(util.CookTest):
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
         self.assertEqual(1, len(job['instances']))
-        message = json.dumps(job['instances'][0], sort_keys=True)
+        message = util.LazyJson(job['instances'][0], sort_keys=True)
         self.assertEqual('success', job['instances'][0]['status'], message)
 
     def test_failing_submit(self):
@@ -248,19 +253,24 @@ class CookTest(util.CookTest):
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
         self.assertEqual(1, len(job['instances']))
         instance = job['instances'][0]
-        message = json.dumps(instance, sort_keys=True)
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertEqual('failed', instance['status'], message)
         self.assertFalse(instance['reason_mea_culpa'], message)
 
-        if util.should_expect_sandbox_directory(instance):
-            instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-            message = json.dumps(instance, sort_keys=True)
+        # Wait for the sandbox directory and the exit code (only reported by the cook executor) together
+        expect_sandbox_directory = util.should_expect_sandbox_directory(instance)
+        fields = ['sandbox_directory'] if expect_sandbox_directory else []
+        if instance['executor'] == 'cook':
+            fields.append('exit_code')
+        if fields:
+            instance = util.wait_for_instance_fields(self.cook_url, job_uuid, fields)
+            message = util.LazyJson(instance, sort_keys=True)
+
+        if expect_sandbox_directory:
             self.assertIsNotNone(instance['output_url'], message)
             self.assertIsNotNone(instance['sandbox_directory'], message)
 
         if instance['executor'] == 'cook':
-            instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-            message = json.dumps(instance, sort_keys=True)
             self.assertEqual(1, instance['exit_code'], message)
         else:
             self.logger.info(f'Exit code not checked because cook executor was not used for {instance}')
@@ -277,17 +287,15 @@ class CookTest(util.CookTest):
                                          executor=job_executor_type, max_runtime=60000)
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
-        message = json.dumps(job['instances'], sort_keys=True)
+        message = util.LazyJson(job['instances'], sort_keys=True)
         self.assertIn('success', (i['status'] for i in job['instances']), message)
 
-        instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        util.sleep_for_publish_interval(self.cook_url)
+        instance = util.wait_for_instance_fields(self.cook_url, job_uuid, ('sandbox_directory', 'exit_code'))
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertIsNotNone(instance['output_url'], message)
         self.assertIsNotNone(instance['sandbox_directory'], message)
         self.assertEqual('cook', instance['executor'])
-        util.sleep_for_publish_interval(self.cook_url)
-        instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
         self.assertEqual(0, instance['exit_code'], message)
         self.assertEqual(25, instance['progress'], message)
         self.assertEqual('Twenty-five percent in progress.txt', instance['progress_message'], message)
@@ -296,27 +304,26 @@ class CookTest(util.CookTest):
     def test_configurable_progress_update_submit(self):
         job_executor_type = util.get_job_executor_type(self.cook_url)
         command = 'echo "message: 25 Twenty-five percent" > progress_file.txt; sleep 1; exit 0'
+        progress_regex_string = r'message: (\d*) (.*)'
         job_uuid, resp = util.submit_job(self.cook_url, command=command, executor=job_executor_type, max_runtime=60000,
                                          progress_output_file='progress_file.txt',
-                                         progress_regex_string='message: (\d*) (.*)')
+                                         progress_regex_string=progress_regex_string)
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
-        message = json.dumps(job, sort_keys=True)
+        message = util.LazyJson(job, sort_keys=True)
         self.assertEqual('progress_file.txt', job['progress_output_file'], message)
-        self.assertEqual('message: (\d*) (.*)', job['progress_regex_string'], message)
+        self.assertEqual(progress_regex_string, job['progress_regex_string'], message)
         self.assertEqual(1, len(job['instances']))
-        message = json.dumps(job['instances'][0], sort_keys=True)
+        message = util.LazyJson(job['instances'][0], sort_keys=True)
         self.assertEqual('success', job['instances'][0]['status'], message)
         self.assertEqual('success', job['instances'][0]['status'], message)
 
-        instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        util.sleep_for_publish_interval(self.cook_url)
+        instance = util.wait_for_instance_fields(self.cook_url, job_uuid, ('sandbox_directory', 'exit_code'))
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertIsNotNone(instance['output_url'], message)
         self.assertIsNotNone(instance['sandbox_directory'], message)
         self.assertEqual('cook', instance['executor'])
-        util.sleep_for_publish_interval(self.cook_url)
-        instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
         self.assertEqual(0, instance['exit_code'], message)
         self.assertEqual(25, instance['progress'], message)
         self.assertEqual('Twenty-five percent', instance['progress_message'], message)
@@ -336,17 +343,17 @@ class CookTest(util.CookTest):
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
         self.assertEqual(1, len(job['instances']))
-        message = json.dumps(job['instances'][0], sort_keys=True)
+        message = util.LazyJson(job['instances'][0], sort_keys=True)
         self.assertEqual('success', job['instances'][0]['status'], message)
 
         instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertIsNotNone(instance['output_url'], message)
         self.assertIsNotNone(instance['sandbox_directory'], message)
         self.assertEqual('cook', instance['executor'])
         util.sleep_for_publish_interval(self.cook_url)
         instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertEqual(0, instance['exit_code'], message)
         self.assertEqual(75, instance['progress'], message)
         self.assertEqual('Seventy-five percent', instance['progress_message'], message)
@@ -358,23 +365,23 @@ class CookTest(util.CookTest):
         def progress_string(a):
             return util.progress_line(self.cook_url, a, f'{a}%')
 
-        items = list(range(1, 100, 4)) + list(range(99, 40, -4)) + list(range(40, 81, 2))
-        command = ''.join([f'echo "{progress_string(a)}" && ' for a in items]) + 'echo "Done" && exit 0'
+        items = itertools.chain(range(1, 100, 4), range(99, 40, -4), range(40, 81, 2))
+        command = ' && '.join(f'echo "{progress_string(a)}"' for a in items) + ' && echo "Done" && exit 0'
         job_uuid, resp = util.submit_job(self.cook_url, command=command, executor=job_executor_type, max_runtime=60000)
         self.assertEqual(201, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
         self.assertEqual(1, len(job['instances']))
-        message = json.dumps(job['instances'][0], sort_keys=True)
+        message = util.LazyJson(job['instances'][0], sort_keys=True)
         self.assertEqual('success', job['instances'][0]['status'], message)
 
         instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertIsNotNone(instance['output_url'], message)
         self.assertIsNotNone(instance['sandbox_directory'], message)
         self.assertEqual('cook', instance['executor'])
         util.sleep_for_publish_interval(self.cook_url)
         instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-        message = json.dumps(instance, sort_keys=True)
+        message = util.LazyJson(instance, sort_keys=True)
         self.assertEqual(0, instance['exit_code'], message)
         self.assertEqual(80, instance['progress'], message)
         self.assertEqual('80%', instance['progress_message'], message)
@@ -403,20 +410,20 @@ class CookTest(util.CookTest):
             util.wait_for_job(self.cook_url, job_uuid, 'running')
             util.wait_for_job(self.cook_url, job_uuid, 'completed', job_sleep_ms)
             job = util.wait_for_end_time(self.cook_url, job_uuid)
-            job_details = f"Job details: {json.dumps(job, sort_keys=True)}"
+            job_details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertEqual(1, len(job['instances']), job_details)
             instance = job['instances'][0]
             # did the job fail as expected?
             self.assertEqual('failed', instance['status'], job_details)
             # We currently have three possible reason codes that we can observe
             # due to a race in the scheduler. See issue #515 on GitHub for more details.
-            allowed_reasons = [
+            allowed_reasons = {
                 # observed status update from when Cook killed the job
                 reasons.MAX_RUNTIME_EXCEEDED,
                 # observed status update received when exit code appears
                 reasons.CMD_NON_ZERO_EXIT,
                 # cook killed the job during setup, so the executor had an error
-                reasons.EXECUTOR_UNREGISTERED]
+                reasons.EXECUTOR_UNREGISTERED}
             self.assertIn(instance['reason_code'], allowed_reasons, job_details)
             # was the actual running time consistent with running over time and being killed?
             actual_running_time_ms = instance['end_time'] - instance['start_time']
@@ -426,12 +433,12 @@ class CookTest(util.CookTest):
             # verify additional fields set when the cook executor is used
             if instance['executor'] == 'cook':
                 instance = util.wait_for_sandbox_directory(self.cook_url, job_uuid)
-                message = json.dumps(instance, sort_keys=True)
+                message = util.LazyJson(instance, sort_keys=True)
                 self.assertIsNotNone(instance['output_url'], message)
                 self.assertIsNotNone(instance['sandbox_directory'], message)
 
                 instance = util.wait_for_exit_code(self.cook_url, job_uuid)
-                message = json.dumps(instance, sort_keys=True)
+                message = util.LazyJson(instance, sort_keys=True)
                 self.assertNotEqual(0, instance['exit_code'], message)
             else:
                 self.logger.info(f'Exit code not checked because cook executor was not used for {instance}')
@@ -487,11 +494,11 @@ class CookTest(util.CookTest):
         job = instance['parent']
         try:
             job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
-            job_details = f"Job details: {json.dumps(job, sort_keys=True)}"
+            job_details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertEqual('failed', job['state'], job_details)
             self.assertLessEqual(1, len(job['instances']), job_details)
             instance = job['instances'][-1]
-            instance_details = json.dumps(instance, sort_keys=True)
+            instance_details = util.LazyJson(instance, sort_keys=True)
             self.logger.debug('instance: %s' % instance)
             # did the job fail as expected?
             self.assertEqual(executor_type, instance['executor'], instance_details)
@@ -507,7 +514,7 @@ class CookTest(util.CookTest):
                 if executor_type == 'cook':
                     instance = util.wait_for_exit_code(self.cook_url, job_uuid)
                     self.logger.info(f'Exit code: {instance["exit_code"]}')
-                    self.assertIn(instance['exit_code'], [137, -9], instance_details)
+                    self.assertIn(instance['exit_code'], {137, -9}, instance_details)
             else:
                 self.fail('Unknown reason code {}, details {}'.format(instance['reason_code'], instance_details))
         finally:
@@ -539,7 +546,7 @@ class CookTest(util.CookTest):
     def test_get_job(self):
         # schedule a job
         job_spec = util.minimal_job()
-        resp = util.session.post('%s/rawscheduler' % self.cook_url, json={'jobs': [job_spec]})
+        resp = util.session.post(self.rawscheduler_url, json={'jobs': [job_spec]})
         self.assertEqual(201, resp.status_code, msg=resp.content)
 
         # query for the same job & ensure the response has what it's supposed to have
@@ -575,9 +582,13 @@ class CookTest(util.CookTest):
         self.assertTrue('task_id' in instance)
 
     def determine_user(self):
-        job_uuid, resp = util.submit_job(self.cook_url)
-        self.assertEqual(resp.status_code, 201)
-        return util.get_user(self.cook_url, job_uuid)
+        # The user is the same for every test in the class, so only submit a probe job once
+        cls = type(self)
+        if cls.user is None:
+            job_uuid, resp = util.submit_job(self.cook_url)
+            self.assertEqual(resp.status_code, 201)
+            cls.user = util.get_user(self.cook_url, job_uuid)
+        return cls.user
 
     def test_list_jobs_by_state(self):
         # schedule a bunch of jobs in hopes of getting jobs into different statuses
@@ -586,8 +597,9 @@ class CookTest(util.CookTest):
             _, resp = util.submit_jobs(self.cook_url, job_specs)
             self.assertEqual(resp.status_code, 201)
 
-            # let some jobs get scheduled
-            time.sleep(10)
+            # let some jobs get scheduled, and the shortest ones complete
+            util.wait_until(lambda: util.query_jobs(self.cook_url, True, uuid=job_specs).json(),
+                            lambda jobs: any(j['status'] == 'completed' for j in jobs))
             user = self.determine_user()
 
             for state in ['waiting', 'running', 'completed']:
@@ -604,16 +616,18 @@ class CookTest(util.CookTest):
         job_specs = [util.minimal_job() for _ in range(2)]
 
         request_body = {'jobs': [job_specs[0]]}
-        resp = util.session.post('%s/rawscheduler' % self.cook_url, json=request_body)
+        resp = util.session.post(self.rawscheduler_url, json=request_body)
         self.assertEqual(resp.status_code, 201)
 
-        time.sleep(5)
+        # submit times have millisecond granularity, so a short pause is enough to tell the jobs apart
+        time.sleep(0.1)
 
         request_body = {'jobs': [job_specs[1]]}
-        resp = util.session.post('%s/rawscheduler' % self.cook_url, json=request_body)
+        resp = util.session.post(self.rawscheduler_url, json=request_body)
         self.assertEqual(resp.status_code, 201)
 
-        submit_times = [util.load_job(self.cook_url, job_spec['uuid'])['submit_time'] for job_spec in job_specs]
+        submit_times = [job['submit_time'] for job in util.load_jobs(self.cook_url, job_specs)]
+        self.assertLess(submit_times[0], submit_times[1])
 
         user = self.determine_user()
 
@@ -623,36 +637,62 @@ class CookTest(util.CookTest):
         resp = util.list_jobs(self.cook_url, user=user, state='waiting+running+completed',
                               start_ms=submit_times[0] - 1, end_ms=submit_times[1] + 1)
         self.assertEqual(200, resp.status_code, msg=resp.content)
-        jobs = resp.json()
-        self.assertTrue(util.contains_job_uuid(jobs, job_specs[0]['uuid']))
-        self.assertTrue(util.contains_job_uuid(jobs, job_specs[1]['uuid']))
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_specs[0]['uuid'], listed_uuids)
+        self.assertIn(job_specs[1]['uuid'], listed_uuids)
 
         # query just for job 1
         resp = util.list_jobs(self.cook_url, user=user, state='waiting+running+completed',
                               start_ms=submit_times[0] - 1, end_ms=submit_times[1])
         self.assertEqual(200, resp.status_code, msg=resp.content)
-        jobs = resp.json()
-        self.assertTrue(util.contains_job_uuid(jobs, job_specs[0]['uuid']))
-        self.assertFalse(util.contains_job_uuid(jobs, job_specs[1]['uuid']))
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_specs[0]['uuid'], listed_uuids)
+        self.assertNotIn(job_specs[1]['uuid'], listed_uuids)
 
         # query just for job 2
         resp = util.list_jobs(self.cook_url, user=user, state='waiting+running+completed',
                               start_ms=submit_times[0] + 1, end_ms=submit_times[1] + 1)
         self.assertEqual(200, resp.status_code, msg=resp.content)
-        jobs = resp.json()
-        self.assertFalse(util.contains_job_uuid(jobs, job_specs[0]['uuid']))
-        self.assertTrue(util.contains_job_uuid(jobs, job_specs[1]['uuid']))
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_specs[0]['uuid'], listed_uuids)
+        self.assertIn(job_specs[1]['uuid'], listed_uuids)
 
         # query for neither
         resp = util.list_jobs(self.cook_url, user=user, state='waiting+running+completed',
                               start_ms=submit_times[0] + 1, end_ms=submit_times[1])
         self.assertEqual(200, resp.status_code, msg=resp.content)
-        jobs = resp.json()
-        self.assertFalse(util.contains_job_uuid(jobs, job_specs[0]['uuid']))
-        self.assertFalse(util.contains_job_uuid(jobs, job_specs[1]['uuid']))
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_specs[0]['uuid'], listed_uuids)
+        self.assertNotIn(job_specs[1]['uuid'], listed_uuids)
+
+    def assert_jobs_listed_by_state(self, list_jobs, encode_states, success_uuid, failed_uuid):
+        """
+        Asserts which of the given successful and failed jobs are listed for various combinations of states;
+        list_jobs takes the states, as encoded by encode_states, and returns the listing response
+        """
+        both = {success_uuid, failed_uuid}
+        cases = [(['completed'], both),
+                 (['success', 'failed'], both),
+                 (['completed', 'success', 'failed'], both),
+                 (['completed', 'failed'], both),
+                 (['completed', 'success'], both),
+                 (['success'], {success_uuid}),
+                 (['running', 'waiting', 'success'], {success_uuid}),
+                 (['failed'], {failed_uuid}),
+                 (['running', 'waiting', 'failed'], {failed_uuid})]
+
+        def list_uuids(states):
+            return util.job_uuids(list_jobs(encode_states(states)).json())
+
+        # The listings are independent, so request them all concurrently
+        with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+            listings = list(executor.map(list_uuids, [states for states, _ in cases]))
+        for (states, expected_uuids), uuids in zip(cases, listings):
+            self.assertEqual(expected_uuids, both & uuids, states)
 
     def test_list_jobs_by_completion_state(self):
         name = str(uuid.uuid4())
+        # The submit-time windows below rely on each job having a distinct submit time, so submit them one at a time
         job_uuid_1, resp = util.submit_job(self.cook_url, command='true', name=name, max_retries=2)
         self.assertEqual(201, resp.status_code)
         job_uuid_2, resp = util.submit_job(self.cook_url, command='false', name=name)
@@ -660,52 +700,33 @@ class CookTest(util.CookTest):
         job_uuid_3, resp = util.submit_job(self.cook_url, command='true', name=name, max_retries=2)
         self.assertEqual(201, resp.status_code)
         user = self.determine_user()
-        start = util.wait_for_job(self.cook_url, job_uuid_1, 'completed')['submit_time']
-        end = util.wait_for_job(self.cook_url, job_uuid_2, 'completed')['submit_time'] + 1
+        jobs = {j['uuid']: j for j in
+                util.wait_for_jobs(self.cook_url, [job_uuid_1, job_uuid_2, job_uuid_3], 'completed')}
+        start = jobs[job_uuid_1]['submit_time']
+        end = jobs[job_uuid_2]['submit_time'] + 1
 
         # Test the various combinations of states
-        resp = util.list_jobs(self.cook_url, user=user, state='completed', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='success+failed', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='completed+success+failed', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='completed+failed', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='completed+success', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='success', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='running+waiting+success', start_ms=start, end_ms=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='failed', start_ms=start, end_ms=end)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.list_jobs(self.cook_url, user=user, state='running+waiting+failed', start_ms=start, end_ms=end)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
+        self.assert_jobs_listed_by_state(
+            lambda state: util.list_jobs(self.cook_url, user=user, state=state, start_ms=start, end_ms=end),
+            '+'.join, job_uuid_1, job_uuid_2)
 
         # Test with failed and a specified limit
         resp = util.list_jobs(self.cook_url, user=user, state='failed', start_ms=start, end_ms=end, limit=1, name=name)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertIn(job_uuid_2, listed_uuids)
 
         # Test with success and a specified limit
         start = end - 1
-        end = util.wait_for_job(self.cook_url, job_uuid_3, 'completed')['submit_time'] + 1
+        end = jobs[job_uuid_3]['submit_time'] + 1
         resp = util.list_jobs(self.cook_url, user=user, state='success', start_ms=start, end_ms=end, limit=1, name=name)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertIn(job_uuid_3, listed_uuids)
 
     def test_list_jobs_by_completion_state_with_jobs_endpoint(self):
         name = str(uuid.uuid4())
+        # The submit-time windows below rely on each job having a distinct submit time, so submit them one at a time
         job_uuid_1, resp = util.submit_job(self.cook_url, command='true', name=name, max_retries=2)
         self.assertEqual(201, resp.status_code)
         job_uuid_2, resp = util.submit_job(self.cook_url, command='false', name=name)
@@ -713,154 +734,137 @@ class CookTest(util.CookTest):
         job_uuid_3, resp = util.submit_job(self.cook_url, command='true', name=name, max_retries=2)
         self.assertEqual(201, resp.status_code)
         user = self.determine_user()
-        start = util.wait_for_job(self.cook_url, job_uuid_1, 'completed')['submit_time']
-        end = util.wait_for_job(self.cook_url, job_uuid_2, 'completed')['submit_time'] + 1
+        jobs = {j['uuid']: j for j in
+                util.wait_for_jobs(self.cook_url, [job_uuid_1, job_uuid_2, job_uuid_3], 'completed')}
+        job_1 = jobs[job_uuid_1]
+        job_2 = jobs[job_uuid_2]
+        start = job_1['submit_time']
+        end = job_2['submit_time'] + 1
 
         # Assert the job states
-        job_1 = util.load_job(self.cook_url, job_uuid_1)
-        job_2 = util.load_job(self.cook_url, job_uuid_2)
         self.logger.info(job_1)
         self.logger.info(job_2)
         self.assertEqual('success', job_1['state'])
         self.assertEqual('failed', job_2['state'])
 
         # Test the various combinations of states
-        resp = util.jobs(self.cook_url, user=user, state='completed', start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['success', 'failed'], start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['completed', 'success', 'failed'], start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['completed', 'failed'], start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['completed', 'success'], start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state='success', start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['running', 'waiting', 'success'], start=start, end=end)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state='failed', start=start, end=end)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        resp = util.jobs(self.cook_url, user=user, state=['running', 'waiting', 'failed'], start=start, end=end)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
+        self.assert_jobs_listed_by_state(
+            lambda state: util.jobs(self.cook_url, user=user, state=state, start=start, end=end),
+            list, job_uuid_1, job_uuid_2)
 
         # Test with failed and a specified limit
         resp = util.jobs(self.cook_url, user=user, state='failed', start=start, end=end, limit=1, name=name)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertIn(job_uuid_2, listed_uuids)
 
         # Test with success and a specified limit
         start = end - 1
-        job_3 = util.wait_for_job(self.cook_url, job_uuid_3, 'completed')
+        job_3 = jobs[job_uuid_3]
         self.logger.info(job_3)
         self.assertEqual('success', job_3['state'])
         end = job_3['submit_time'] + 1
         resp = util.jobs(self.cook_url, user=user, state='success', start=start, end=end, limit=1, name=name)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertIn(job_uuid_3, listed_uuids)
 
     def test_list_jobs_by_name(self):
-        job_uuid_1, resp = util.submit_job(self.cook_url, name='foo-bar-baz_qux')
-        self.assertEqual(201, resp.status_code)
-        job_uuid_2, resp = util.submit_job(self.cook_url, name='')
-        self.assertEqual(201, resp.status_code)
-        job_uuid_3, resp = util.submit_job(self.cook_url, name='.')
-        self.assertEqual(201, resp.status_code)
-        job_uuid_4, resp = util.submit_job(self.cook_url, name='foo-bar-baz__')
-        self.assertEqual(201, resp.status_code)
-        job_uuid_5, resp = util.submit_job(self.cook_url, name='ff')
-        self.assertEqual(201, resp.status_code)
-        job_uuid_6, resp = util.submit_job(self.cook_url, name='a')
+        names = ['foo-bar-baz_qux', '', '.', 'foo-bar-baz__', 'ff', 'a']
+        job_uuids, resp = util.submit_jobs(self.cook_url, [{'name': n} for n in names])
         self.assertEqual(201, resp.status_code)
+        job_uuid_1, job_uuid_2, job_uuid_3, job_uuid_4, job_uuid_5, job_uuid_6 = job_uuids
         user = self.determine_user()
         any_state = 'running+waiting+completed'
 
         resp = util.list_jobs(self.cook_url, user=user, state=any_state)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_uuid_1, listed_uuids)
+        self.assertIn(job_uuid_2, listed_uuids)
+        self.assertIn(job_uuid_3, listed_uuids)
+        self.assertIn(job_uuid_4, listed_uuids)
+        self.assertIn(job_uuid_5, listed_uuids)
+        self.assertIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='*')
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_uuid_1, listed_uuids)
+        self.assertIn(job_uuid_2, listed_uuids)
+        self.assertIn(job_uuid_3, listed_uuids)
+        self.assertIn(job_uuid_4, listed_uuids)
+        self.assertIn(job_uuid_5, listed_uuids)
+        self.assertIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='foo-bar-baz_qux')
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='foo-bar-baz_*')
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='f*')
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertIn(job_uuid_4, listed_uuids)
+        self.assertIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='*.*')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='foo-bar-baz__*')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='ff*')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='a*')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertTrue(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertIn(job_uuid_6, listed_uuids)
         resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='a-z0-9_-')
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_1), job_uuid_1)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_2), job_uuid_2)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_3), job_uuid_3)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_4), job_uuid_4)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_5), job_uuid_5)
-        self.assertFalse(util.contains_job_uuid(resp.json(), job_uuid_6), job_uuid_6)
+        listed_uuids = util.job_uuids(resp.json())
+        self.assertNotIn(job_uuid_1, listed_uuids)
+        self.assertNotIn(job_uuid_2, listed_uuids)
+        self.assertNotIn(job_uuid_3, listed_uuids)
+        self.assertNotIn(job_uuid_4, listed_uuids)
+        self.assertNotIn(job_uuid_5, listed_uuids)
+        self.assertNotIn(job_uuid_6, listed_uuids)
 
     def test_list_jobs_by_pool(self):
         # Submit two jobs to each active pool -- one that will be
@@ -870,14 +874,24 @@ class CookTest(util.CookTest):
         pools, _ = util.active_pools(self.cook_url)
         start = util.current_milli_time()
         sleep_command = 'sleep 600'
-        for pool in pools:
-            pool_name = pool['name']
-            job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, name=name, command=sleep_command)
-            self.assertEqual(201, resp.status_code)
-            jobs.append(util.load_job(self.cook_url, job_uuid))
-            job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, name=name, command='exit 0')
-            self.assertEqual(201, resp.status_code)
-            jobs.append(util.wait_for_job(self.cook_url, job_uuid, 'completed'))
+        sleep_job_uuids = []
+        exit_job_uuids = []
+
+        def submit_pool_jobs(pool):
+            return util.submit_jobs(self.cook_url, [{'name': name, 'command': sleep_command},
+                                                    {'name': name, 'command': 'exit 0'}],
+                                    pool=pool['name'])
+
+        # Each submission can only target one pool, so submit to the pools concurrently
+        with ThreadPoolExecutor(max_workers=max(len(pools), 1)) as executor:
+            for job_uuids, resp in executor.map(submit_pool_jobs, pools):
+                self.assertEqual(201, resp.status_code)
+                sleep_job_uuids.append(job_uuids[0])
+                exit_job_uuids.append(job_uuids[1])
+        if len(pools) > 0:
+            # Load the sleeping jobs and wait for the exiting jobs across all pools at once
+            jobs.extend(util.load_jobs(self.cook_url, sleep_job_uuids))
+            jobs.extend(util.wait_for_jobs(self.cook_url, exit_job_uuids, 'completed'))
         end = util.current_milli_time() + 1
 
         try:
@@ -962,16 +976,16 @@ class CookTest(util.CookTest):
     def test_list_with_invalid_name_filters(self):
         user = self.determine_user()
         any_state = 'running+waiting+completed'
-        resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='^[a-z0-9_-]{3,16}$')
-        self.assertEqual(400, resp.status_code)
-        resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='[a-z0-9_-]{3,16}')
-        self.assertEqual(400, resp.status_code)
-        resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='[a-z0-9_-]')
-        self.assertEqual(400, resp.status_code)
-        resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='\d+')
-        self.assertEqual(400, resp.status_code)
-        resp = util.list_jobs(self.cook_url, user=user, state=any_state, name='a+')
-        self.assertEqual(400, resp.status_code)
+        names = ['^[a-z0-9_-]{3,16}$', '[a-z0-9_-]{3,16}', '[a-z0-9_-]', r'\d+', 'a+']
+
+        def list_jobs_named(name):
+            return util.list_jobs(self.cook_url, user=user, state=any_state, name=name)
+
+        # The filter is validated by the server, so still send every request, but send them concurrently
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            responses = list(executor.map(list_jobs_named, names))
+        for name, resp in zip(names, responses):
+            self.assertEqual(400, resp.status_code, name)
 
     def test_cancel_job(self):
         job_uuid, _ = util.submit_job(self.cook_url, command='sleep 300')
@@ -995,7 +1009,7 @@ class CookTest(util.CookTest):
             resp = util.retry_jobs(self.cook_url, retries=2, jobs=[job_uuid])
             self.assertEqual(201, resp.status_code, resp.text)
             job = util.load_job(self.cook_url, job_uuid)
-            details = f"Job details: {json.dumps(job, sort_keys=True)}"
+            details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertIn(job['status'], ['waiting', 'running'], details)
             self.assertEqual(1, job['retries_remaining'], details)
         finally:
@@ -1016,7 +1030,7 @@ class CookTest(util.CookTest):
             resp = util.retry_jobs(self.cook_url, use_deprecated_post=True, retries=2, jobs=[job_uuid])
             self.assertEqual(201, resp.status_code, resp.text)
             job = util.load_job(self.cook_url, job_uuid)
-            details = f"Job details: {json.dumps(job, sort_keys=True)}"
+            details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertIn(job['status'], ['waiting', 'running'], details)
             self.assertEqual(1, job['retries_remaining'], details)
         finally:
@@ -1046,12 +1060,12 @@ class CookTest(util.CookTest):
             # We expect both jobs to be running now.
             # The first job (which we killed and retried) should have 3 retries remaining
             # (the attempt before resetting the total retries count is still included).
-            job_details = f"Job details: {json.dumps(jobs[0], sort_keys=True)}"
+            job_details = util.LazyJson(jobs[0], 'Job details: ', sort_keys=True)
             self.assertIn(jobs[0]['status'], ['waiting', 'running'], job_details)
             self.assertEqual(3, jobs[0]['retries_remaining'], job_details)
             # The second job (which started with the default 1 retries)
             # should have 1 remaining since the failed_only flag was set.
-            job_details = f"Job details: {json.dumps(jobs[1], sort_keys=True)}"
+            job_details = util.LazyJson(jobs[1], 'Job details: ', sort_keys=True)
             self.assertIn(jobs[1]['status'], ['waiting', 'running'], job_details)
             self.assertEqual(1, jobs[1]['retries_remaining'], job_details)
         finally:
@@ -1061,10 +1075,10 @@ class CookTest(util.CookTest):
         job_uuid, _ = util.submit_job(self.cook_url, command='sleep 10', max_retries=2)
         job = util.wait_for_job(self.cook_url, job_uuid, 'running')
         task_id = job['instances'][0]['task_id']
-        resp = util.session.delete('%s/rawscheduler?instance=%s' % (self.cook_url, task_id))
+        resp = util.session.delete(self.rawscheduler_url, params={'instance': task_id})
         self.assertEqual(204, resp.status_code, msg=resp.content)
         job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
-        self.assertEqual('success', job['state'], 'Job details: %s' % (json.dumps(job, sort_keys=True)))
+        self.assertEqual('success', job['state'], util.LazyJson(job, 'Job details: ', sort_keys=True))
 
     def test_no_such_group(self):
         group_uuid = str(uuid.uuid4())
@@ -1085,8 +1099,7 @@ class CookTest(util.CookTest):
         job_data = job_data.json()
         self.assertEqual(group_uuid, job_data[0]['groups'][0]['uuid'])
         self.assertEqual(group_uuid, job_data[1]['groups'][0]['uuid'])
-        util.wait_for_job(self.cook_url, jobs[0], 'completed')
-        util.wait_for_job(self.cook_url, jobs[1], 'completed')
+        util.wait_for_jobs(self.cook_url, jobs, 'completed')
 
     def test_explicit_group(self):
         group_spec = util.minimal_group()
@@ -1099,8 +1112,7 @@ class CookTest(util.CookTest):
         job_data = job_data.json()
         self.assertEqual(group_uuid, job_data[0]['groups'][0]['uuid'])
         self.assertEqual(group_uuid, job_data[1]['groups'][0]['uuid'])
-        util.wait_for_job(self.cook_url, jobs[0], 'completed')
-        util.wait_for_job(self.cook_url, jobs[1], 'completed')
+        util.wait_for_jobs(self.cook_url, jobs, 'completed')
 
     def test_straggler_handling(self):
         straggler_handling = {
@@ -1116,14 +1128,14 @@ class CookTest(util.CookTest):
         job_slow = util.minimal_job(group=group_spec["uuid"],
                                     command='sleep %d' % slow_job_wait_seconds)
         data = {'jobs': [job_fast, job_slow], 'groups': [group_spec]}
-        resp = util.session.post('%s/rawscheduler' % self.cook_url, json=data)
+        resp = util.session.post(self.rawscheduler_url, json=data)
         self.assertEqual(resp.status_code, 201)
-        util.wait_for_job(self.cook_url, job_fast['uuid'], 'completed')
-        util.wait_for_job(self.cook_url, job_slow['uuid'], 'completed',
-                          slow_job_wait_seconds * 1000)
-        jobs = util.query_jobs(self.cook_url, True, uuid=[job_fast, job_slow]).json()
+        job_uuids = [job_fast['uuid'], job_slow['uuid']]
+        jobs = {j['uuid']: j for j in util.wait_for_jobs(self.cook_url, job_uuids, 'completed',
+                                                         slow_job_wait_seconds * 1000)}
+        jobs = [jobs[job_uuid] for job_uuid in job_uuids]
         self.logger.debug('Loaded jobs %s', jobs)
-        self.assertEqual('success', jobs[0]['state'], 'Job details: %s' % (json.dumps(jobs[0], sort_keys=True)))
+        self.assertEqual('success', jobs[0]['state'], util.LazyJson(jobs[0], 'Job details: ', sort_keys=True))
         self.assertEqual('failed', jobs[1]['state'])
         self.assertEqual(2004, jobs[1]['instances'][0]['reason_code'])
 
@@ -1160,8 +1172,7 @@ class CookTest(util.CookTest):
     def test_error_while_creating_job(self):
         job1 = util.minimal_job()
         job2 = util.minimal_job(uuid=job1['uuid'])
-        resp = util.session.post('%s/rawscheduler' % self.cook_url,
-                                 json={'jobs': [job1, job2]})
+        resp = util.session.post(self.rawscheduler_url, json={'jobs': [job1, job2]})
         self.assertEqual(resp.status_code, 400)
         self.assertEqual(f'Duplicate job uuids: ["{job1["uuid"]}"]', resp.json()['error'], resp.text)
 
@@ -1175,18 +1186,19 @@ class CookTest(util.CookTest):
         self.assertEqual(resp.status_code, 201, resp.text)
 
         try:
-            host_to_job_uuid = {}
-            for host in hosts:
-                hostname = host['hostname']
-                constraints = [["HOSTNAME", "EQUALS", hostname]]
-                job_uuid, resp = util.submit_job(self.cook_url, constraints=constraints, name=self.current_name())
-                self.assertEqual(resp.status_code, 201, resp.text)
-                host_to_job_uuid[hostname] = job_uuid
+            hostnames = [host['hostname'] for host in hosts]
+            name = self.current_name()
+            job_specs = [util.minimal_job(constraints=[["HOSTNAME", "EQUALS", hostname]], name=name)
+                         for hostname in hostnames]
+            job_uuids, resp = util.submit_jobs(self.cook_url, job_specs)
+            self.assertEqual(resp.status_code, 201, resp.text)
+            host_to_job_uuid = dict(zip(hostnames, job_uuids))
 
             try:
+                self.logger.info(f'Waiting for jobs {job_uuids} to complete')
+                jobs = {job['uuid']: job for job in util.wait_for_jobs(self.cook_url, job_uuids, 'completed')}
                 for hostname, job_uuid in host_to_job_uuid.items():
-                    self.logger.info(f'Waiting for job {job_uuid} to complete')
-                    job = util.wait_for_job(self.cook_url, job_uuid, 'completed')
+                    job = jobs[job_uuid]
                     hostname_constrained = job['instances'][0]['hostname']
                     self.assertEqual(hostname, hostname_constrained)
                     self.assertEqual([["HOSTNAME", "EQUALS", hostname]], job['constraints'])
@@ -1203,9 +1215,7 @@ class CookTest(util.CookTest):
         def absent_uuids(response):
             return [part for part in response.json()['error'].split() if util.is_valid_uuid(part)]
 
-        job_uuid_1, resp = util.submit_job(self.cook_url)
-        self.assertEqual(201, resp.status_code, msg=resp.content)
-        job_uuid_2, resp = util.submit_job(self.cook_url)
+        (job_uuid_1, job_uuid_2), resp = util.submit_jobs(self.cook_url, util.minimal_jobs(2))
         self.assertEqual(201, resp.status_code, msg=resp.content)
 
         # Only valid job uuids
@@ -1225,15 +1235,16 @@ class CookTest(util.CookTest):
         resp = util.query_jobs(self.cook_url, uuid=[job_uuid_1, job_uuid_2, bogus_uuid], partial=True)
         self.assertEqual(200, resp.status_code, resp.json())
         self.assertEqual(2, len(resp.json()))
-        self.assertEqual([job_uuid_1, job_uuid_2].sort(), [job['uuid'] for job in resp.json()].sort())
+        self.assertEqual(sorted([job_uuid_1, job_uuid_2]), sorted(job['uuid'] for job in resp.json()))
 
         # Only valid instance uuids
-        instance_uuid_1 = util.wait_for_instance(self.cook_url, job_uuid_1)['task_id']
-        instance_uuid_2 = util.wait_for_instance(self.cook_url, job_uuid_2)['task_id']
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instances = executor.map(lambda j: util.wait_for_instance(self.cook_url, j), [job_uuid_1, job_uuid_2])
+            instance_uuid_1, instance_uuid_2 = [instance['task_id'] for instance in instances]
         resp = util.query_instances(self.cook_url, uuid=[instance_uuid_1, instance_uuid_2])
         self.assertEqual(200, resp.status_code, msg=resp.content)
         self.assertEqual(2, len(resp.json()))
-        self.assertEqual([job_uuid_1, job_uuid_2].sort(), [instance['job']['uuid'] for instance in resp.json()].sort())
+        self.assertEqual(sorted([job_uuid_1, job_uuid_2]), sorted(instance['job']['uuid'] for instance in resp.json()))
 
         # Mixed valid, invalid instance uuids
         instance_uuids = [instance_uuid_1, instance_uuid_2, bogus_uuid]
@@ -1248,7 +1259,7 @@ class CookTest(util.CookTest):
         resp = util.query_instances(self.cook_url, uuid=instance_uuids, partial=True)
         self.assertEqual(200, resp.status_code, msg=resp.content)
         self.assertEqual(2, len(resp.json()))
-        self.assertEqual([job_uuid_1, job_uuid_2].sort(), [instance['job']['uuid'] for instance in resp.json()].sort())
+        self.assertEqual(sorted([job_uuid_1, job_uuid_2]), sorted(instance['job']['uuid'] for instance in resp.json()))
 
     def test_ports(self):
         job_uuid, resp = util.submit_job(self.cook_url, ports=1)
@@ -1264,9 +1275,7 @@ class CookTest(util.CookTest):
 
         group_uuid_1 = str(uuid.uuid4())
         group_uuid_2 = str(uuid.uuid4())
-        _, resp = util.submit_job(self.cook_url, group=group_uuid_1)
-        self.assertEqual(201, resp.status_code)
-        _, resp = util.submit_job(self.cook_url, group=group_uuid_2)
+        _, resp = util.submit_jobs(self.cook_url, [{'group': group_uuid_1}, {'group': group_uuid_2}])
         self.assertEqual(201, resp.status_code)
 
         # Only valid group uuids
@@ -1286,7 +1295,7 @@ class CookTest(util.CookTest):
         resp = util.query_groups(self.cook_url, uuid=[group_uuid_1, group_uuid_2, bogus_uuid], partial='true')
         self.assertEqual(200, resp.status_code, resp.json())
         self.assertEqual(2, len(resp.json()))
-        self.assertEqual([group_uuid_1, group_uuid_2].sort(), [group['uuid'] for group in resp.json()].sort())
+        self.assertEqual(sorted([group_uuid_1, group_uuid_2]), sorted(group['uuid'] for group in resp.json()))
 
     def test_detailed_for_groups(self):
         detail_keys = ('waiting', 'running', 'completed')
@@ -1320,11 +1329,15 @@ class CookTest(util.CookTest):
             job_slow = util.minimal_job(group=group_uuid, command=f'sleep {slow_job_wait_seconds}', max_retries=2)
             _, resp = util.submit_jobs(self.cook_url, [job_fast, job_slow], groups=[group_spec])
             self.assertEqual(resp.status_code, 201, resp.text)
-            # Wait for the fast job to finish, and the slow job to start
-            util.wait_for_job(self.cook_url, job_fast, 'completed')
-            job = util.load_job(self.cook_url, job_fast['uuid'])
-            self.assertEqual('success', job['state'], f"Job details: {json.dumps(job, sort_keys=True)}")
-            util.wait_for_job(self.cook_url, job_slow, 'running')
+            # Wait for the fast job to finish, and the slow job to start, polling both at once
+            def fast_completed_slow_running(response):
+                fast, slow = response.json()
+                self.logger.info(f"Fast job has status {fast['status']}, slow job has status {slow['status']}")
+                return fast['status'] == 'completed' and slow['status'] == 'running'
+
+            jobs = util.wait_until(lambda: util.query_jobs(self.cook_url, True, uuid=[job_fast, job_slow]),
+                                   fast_completed_slow_running).json()
+            self.assertEqual('success', jobs[0]['state'], util.LazyJson(jobs[0], 'Job details: ', sort_keys=True))
             # Now try to cancel the group (just the slow job)
             util.kill_groups(self.cook_url, [group_uuid])
 
@@ -1335,8 +1348,8 @@ class CookTest(util.CookTest):
             util.wait_until(query, util.all_instances_killed)
             # The fast job should have Success, slow job Failed (because we killed it)
             jobs = util.query_jobs(self.cook_url, True, uuid=[job_fast, job_slow]).json()
-            self.assertEqual('success', jobs[0]['state'], f"Job details: {json.dumps(jobs[0], sort_keys=True)}")
-            slow_job_details = f"Job details: {json.dumps(jobs[1], sort_keys=True)}"
+            self.assertEqual('success', jobs[0]['state'], util.LazyJson(jobs[0], 'Job details: ', sort_keys=True))
+            slow_job_details = util.LazyJson(jobs[1], 'Job details: ', sort_keys=True)
             self.assertEqual('failed', jobs[1]['state'], slow_job_details)
             valid_reasons = [
                 # cook killed the job, so it exits non-zero
@@ -1393,13 +1406,13 @@ class CookTest(util.CookTest):
         jobs = util.group_submit_kill_retry(self.cook_url, retry_failed_jobs_only=False)
         # ensure none of the jobs are still in a failed state
         for job in jobs:
-            self.assertNotEqual('failed', job['state'], f'Job details: {json.dumps(job, sort_keys=True)}')
+            self.assertNotEqual('failed', job['state'], util.LazyJson(job, 'Job details: ', sort_keys=True))
 
     def test_group_change_killed_retries_failed_only(self):
         jobs = util.group_submit_kill_retry(self.cook_url, retry_failed_jobs_only=True)
         # ensure none of the jobs are still in a failed state
         for job in jobs:
-            self.assertNotEqual('failed', job['state'], f'Job details: {json.dumps(job, sort_keys=True)}')
+            self.assertNotEqual('failed', job['state'], util.LazyJson(job, 'Job details: ', sort_keys=True))
 
     def test_group_change_retries(self):
         group_spec = util.minimal_group()
@@ -1445,7 +1458,7 @@ class CookTest(util.CookTest):
             job_data = util.query_jobs(self.cook_url, uuid=jobs)
             self.assertEqual(200, job_data.status_code)
             for job in job_data.json():
-                job_details = f'Job details: {json.dumps(job, sort_keys=True)}'
+                job_details = util.LazyJson(job, 'Job details: ', sort_keys=True)
                 # Jobs that ran twice will have 10 retries remaining,
                 # Jobs that ran once will have 11 retries remaining.
                 # Jobs that were running during the reset and are still running
@@ -1460,7 +1473,7 @@ class CookTest(util.CookTest):
         statuses = ['running', 'waiting']
         jobs = util.group_submit_retry(self.cook_url, command='sleep 120', predicate_statuses=statuses)
         for job in jobs:
-            job_details = f'Job details: {json.dumps(job, sort_keys=True)}'
+            job_details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertIn(job['status'], statuses, job_details)
             self.assertEqual(job['retries_remaining'], 1, job_details)
             self.assertLessEqual(len(job['instances']), 1, job_details)
@@ -1469,7 +1482,7 @@ class CookTest(util.CookTest):
         statuses = ['completed']
         jobs = util.group_submit_retry(self.cook_url, command='exit 0', predicate_statuses=statuses)
         for job in jobs:
-            job_details = f'Job details: {json.dumps(job, sort_keys=True, indent=2)}'
+            job_details = util.LazyJson(job, 'Job details: ', sort_keys=True, indent=2)
             self.assertIn(job['status'], statuses, job_details)
             self.assertEqual(0, job['retries_remaining'], job_details)
             self.assertLessEqual(1, len(job['instances']), job_details)
@@ -1478,7 +1491,7 @@ class CookTest(util.CookTest):
         statuses = ['completed']
         jobs = util.group_submit_retry(self.cook_url, command='exit 1', predicate_statuses=statuses)
         for job in jobs:
-            job_details = f'Job details: {json.dumps(job, sort_keys=True, indent=2)}'
+            job_details = util.LazyJson(job, 'Job details: ', sort_keys=True, indent=2)
             self.assertIn(job['status'], statuses, job_details)
             self.assertEqual(0, job['retries_remaining'], job_details)
             self.assertLessEqual(2, len(job['instances']), job_details)
@@ -1499,14 +1512,16 @@ class CookTest(util.CookTest):
             pool = default_pool or 'no-pool'
             self.logger.info(f'Checking the queue endpoint for pool {pool}')
 
+            uuid_set = set(uuids)
+
             def query_queue():
                 return util.query_queue(self.cook_url)
 
             def queue_predicate(resp):
-                return any([job['job/uuid'] in uuids for job in resp.json()[pool]])
+                return any(job['job/uuid'] in uuid_set for job in resp.json()[pool])
 
             resp = util.wait_until(query_queue, queue_predicate)
-            job = [job for job in resp.json()[pool] if job['job/uuid'] in uuids][0]
+            job = next(job for job in resp.json()[pool] if job['job/uuid'] in uuid_set)
             job_group = job['group/_job'][0]
             self.assertEqual(200, resp.status_code, resp.content)
             self.assertTrue('group/_job' in job.keys())
@@ -1549,13 +1564,12 @@ class CookTest(util.CookTest):
         self.logger.debug('instance: %s' % instance)
         try:
             # Get agent host/port
-            state = util.get_mesos_state(self.mesos_url)
-            agent = [agent for agent in state['slaves']
-                       if agent['hostname'] == instance['hostname']][0]
+            mesos_slaves = util.get_mesos_slaves(self.mesos_url)
+            agent = next(agent for agent in mesos_slaves['slaves'] if agent['hostname'] == instance['hostname'])
 
             # Get container ID from agent
             def agent_query():
-                return util.session.get(util.get_agent_endpoint(state, instance['hostname']))
+                return util.session.get(util.get_agent_endpoint(mesos_slaves, instance['hostname']))
 
             def contains_executor_predicate(agent_response):
                 agent_state = agent_response.json()
@@ -1571,30 +1585,36 @@ class CookTest(util.CookTest):
             container_name = 'mesos-%s.%s' % (agent['id'], executor['container'])
             self.logger.debug(f'Container name: {container_name}')
 
-            @retry(stop_max_delay=60000, wait_fixed=1000)  # Wait for docker container to start
+            docker_ps = ['docker', 'ps', '--all', '--filter', f'name={container_name}', '--format', '{{.ID}}']
+
+            # Wait up to 60s for the docker container to start, polling after 250ms and doubling the interval up to 1s
+            @retry(stop_max_delay=60000, wait_exponential_multiplier=125, wait_exponential_max=1000)
             def get_docker_info():
-                job = util.load_job(self.cook_url, job_uuid)
-                self.logger.info(f'Job status is {job["status"]}: {job}')
-                containers = subprocess.check_output(['docker', 'ps', '--all', '--last', '10']).decode('utf-8')
-                self.logger.info(f'Last 10 containers: {containers}')
-                docker_ps = ['docker', 'ps', '--all', '--filter', f'name={container_name}', '--format', '{{.ID}}']
-                container_id = subprocess.check_output(docker_ps).decode('utf-8').strip()
+                container_id = subprocess.check_output(docker_ps, universal_newlines=True).strip()
                 self.logger.debug(f'Container ID: [{container_id}]')
-                container_json = subprocess.check_output(['docker', 'inspect', container_id]).decode('utf-8')
+                if not container_id:
+                    # Only load the job and list the recent containers when ours is missing,
+                    # since that's when they're useful
+                    job = util.load_job(self.cook_url, job_uuid)
+                    self.logger.info(f'Job status is {job["status"]}: {job}')
+                    containers = subprocess.check_output(['docker', 'ps', '--all', '--last', '10'],
+                                                         universal_newlines=True)
+                    self.logger.info(f'Last 10 containers: {containers}')
+                    raise RuntimeError(f'No container named {container_name} yet')
+                container_json = subprocess.check_output(['docker', 'inspect', container_id], universal_newlines=True)
                 self.logger.debug(f'Container JSON: {container_json}')
                 return json.loads(container_json)
 
             docker_info = get_docker_info()
             ports = docker_info[0]['HostConfig']['PortBindings']
             self.logger.debug('ports: %s' % ports)
-            self.assertTrue('8080/tcp' in ports)
-            self.assertEqual(instance['ports'][0], int(ports['8080/tcp'][0]['HostPort']))
-            self.assertTrue('9090/udp' in ports)
-            self.assertEqual(instance['ports'][1], int(ports['9090/udp'][0]['HostPort']))
+            for index, container_port in enumerate(['8080/tcp', '9090/udp']):
+                self.assertIn(container_port, ports)
+                self.assertEqual(instance['ports'][index], int(ports[container_port][0]['HostPort']))
         finally:
             job = util.load_job(self.cook_url, job_uuid)
             self.logger.info(f'Job status is {job["status"]}: {job}')
-            util.session.delete('%s/rawscheduler?job=%s' % (self.cook_url, job_uuid))
+            util.session.delete(self.rawscheduler_url, params={'job': job_uuid})
             mesos.dump_sandbox_files(util.session, instance, job)
 
     def test_unscheduled_jobs(self):
@@ -1604,27 +1624,27 @@ class CookTest(util.CookTest):
         uuids, resp = util.submit_jobs(self.cook_url, job_spec, clones=100)
         self.assertEqual(resp.status_code, 201, resp.content)
         try:
-            job_uuid_1, resp = util.submit_job(self.cook_url, command='ls', priority=1)
-            self.assertEqual(resp.status_code, 201, resp.content)
-            job_uuid_2, resp = util.submit_job(self.cook_url, command='ls', priority=1)
+            (job_uuid_1, job_uuid_2), resp = util.submit_jobs(self.cook_url, {'command': 'ls', 'priority': 1}, clones=2)
             self.assertEqual(resp.status_code, 201, resp.content)
             jobs, _ = util.unscheduled_jobs(self.cook_url, job_uuid_1, job_uuid_2)
             self.logger.info(f'Unscheduled jobs: {jobs}')
             # If the job from the test is submitted after another one, unscheduled_jobs will report "There are jobs
             # ahead of this in the queue" so we cannot assert that there is exactly one failure reason.
-            self.assertTrue(any([reasons.UNDER_INVESTIGATION == reason['reason'] for reason in jobs[0]['reasons']]))
-            self.assertTrue(any([reasons.UNDER_INVESTIGATION == reason['reason'] for reason in jobs[1]['reasons']]))
+            self.assertTrue(any(reasons.UNDER_INVESTIGATION == reason['reason'] for reason in jobs[0]['reasons']))
+            self.assertTrue(any(reasons.UNDER_INVESTIGATION == reason['reason'] for reason in jobs[1]['reasons']))
             self.assertEqual(job_uuid_1, jobs[0]['uuid'])
             self.assertEqual(job_uuid_2, jobs[1]['uuid'])
 
-            @retry(stop_max_delay=60000, wait_fixed=5000)
+            pattern = re.compile('^You have (at least )?[0-9]+ other jobs ahead in the queue.$')
+
+            # Poll for up to 60s, first after 250ms and then doubling the interval up to 5s
+            @retry(stop_max_delay=60000, wait_exponential_multiplier=125, wait_exponential_max=5000)
             def check_unscheduled_reason():
                 jobs, _ = util.unscheduled_jobs(self.cook_url, job_uuid_1, job_uuid_2)
                 self.logger.info(f'Unscheduled jobs: {jobs}')
-                pattern = re.compile('^You have (at least )?[0-9]+ other jobs ahead in the queue.$')
-                self.assertTrue(any([pattern.match(reason['reason']) for reason in jobs[0]['reasons']]),
+                self.assertTrue(any(pattern.match(reason['reason']) for reason in jobs[0]['reasons']),
                                 jobs[0]['reasons'])
-                self.assertTrue(any([pattern.match(reason['reason']) for reason in jobs[1]['reasons']]),
+                self.assertTrue(any(pattern.match(reason['reason']) for reason in jobs[1]['reasons']),
                                 jobs[1]['reasons'])
                 self.assertEqual(job_uuid_1, jobs[0]['uuid'])
                 self.assertEqual(job_uuid_2, jobs[1]['uuid'])
@@ -1661,8 +1681,9 @@ class CookTest(util.CookTest):
 
             def num_running_predicate(response):
                 num_jobs_total = len(response)
-                num_running = len([j for j in response if j['status'] == 'running'])
-                num_waiting = len([j for j in response if j['status'] == 'waiting'])
+                status_counts = Counter(j['status'] for j in response)
+                num_running = status_counts['running']
+                num_waiting = status_counts['waiting']
                 self.logger.info(f'There are {num_jobs_total} total jobs, {num_running} running jobs, '
                                  f'and {num_waiting} waiting job(s)')
                 if num_jobs_total == num_hosts + 1:
@@ -1686,13 +1707,13 @@ class CookTest(util.CookTest):
 
                 def query():
                     unscheduled = util.unscheduled_jobs(self.cook_url, job_uuid)[0][0]
-                    self.logger.info(f"unscheduled_jobs response: {unscheduled}")
+                    self.logger.info('unscheduled_jobs response: %s', unscheduled)
                     return unscheduled
 
                 def check_unique_constraint(response):
-                    return any([r['reason'] == reasons.COULD_NOT_PLACE_JOB or
-                                r['reason'] == reasons.JOB_IS_RUNNING_NOW
-                                for r in response['reasons']])
+                    return any(r['reason'] == reasons.COULD_NOT_PLACE_JOB or
+                               r['reason'] == reasons.JOB_IS_RUNNING_NOW
+                               for r in response['reasons'])
 
                 unscheduled_jobs = util.wait_until(query, check_unique_constraint)
                 unique_reasons = [r for r in unscheduled_jobs['reasons'] if r['reason'] == reasons.COULD_NOT_PLACE_JOB]
@@ -1737,8 +1758,9 @@ class CookTest(util.CookTest):
 
             def num_running_predicate(response):
                 num_jobs_total = len(response)
-                num_running = len([j for j in response if j['status'] == 'running'])
-                num_waiting = len([j for j in response if j['status'] == 'waiting'])
+                status_counts = Counter(j['status'] for j in response)
+                num_running = status_counts['running']
+                num_waiting = status_counts['waiting']
                 self.logger.info(f'There are {num_jobs_total} total jobs, {num_running} running jobs, '
                                  f'and {num_waiting} waiting job(s)')
                 return num_running == num_hosts and num_waiting == 1
@@ -1759,7 +1781,7 @@ class CookTest(util.CookTest):
                                      if (reason['reason'] == reasons.COULD_NOT_PLACE_JOB
                                          and any(r for r in reason['data']['reasons'] if r['reason'] == constraint)) or
                                      reason['reason'] == reasons.JOB_IS_RUNNING_NOW]
-                self.logger.info(f"unscheduled_jobs response: {resp}")
+                self.logger.info('unscheduled_jobs response: %s', resp)
                 return placement_reasons
 
             placement_reasons = util.wait_until(query_unscheduled, lambda r: len(r) > 0)
@@ -1840,14 +1862,14 @@ class CookTest(util.CookTest):
             }
 
             def query():
-                unscheduled_jobs, _ = util.unscheduled_jobs(self.cook_url, *[j['uuid'] for j in jobs])
-                self.logger.info(f"unscheduled_jobs response: {json.dumps(unscheduled_jobs, indent=2)}")
-                no_hosts = [reason for job in unscheduled_jobs for reason in job['reasons']
-                            if reason['reason'] == "The job couldn't be placed on any available hosts."]
-                for no_hosts_reason in no_hosts:
-                    for sub_reason in no_hosts_reason['data']['reasons']:
-                        if sub_reason['reason'] in reasons:
-                            return sub_reason
+                unscheduled_jobs, _ = util.unscheduled_jobs(self.cook_url, *uuids)
+                self.logger.info('unscheduled_jobs response: %s', util.LazyJson(unscheduled_jobs, indent=2))
+                for job in unscheduled_jobs:
+                    for reason in job['reasons']:
+                        if reason['reason'] == "The job couldn't be placed on any available hosts.":
+                            for sub_reason in reason['data']['reasons']:
+                                if sub_reason['reason'] in reasons:
+                                    return sub_reason
                 return None
 
             reason = util.wait_until(query, lambda r: r is not None)
@@ -1871,8 +1893,9 @@ class CookTest(util.CookTest):
         self.assertEqual(job_uuid_2, resp.json()[1]['uuid'])
 
         # Query by instance uuid
-        instance_uuid_1 = util.wait_for_instance(self.cook_url, job_uuid_1)['task_id']
-        instance_uuid_2 = util.wait_for_instance(self.cook_url, job_uuid_2)['task_id']
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instances = executor.map(lambda j: util.wait_for_instance(self.cook_url, j), [job_uuid_1, job_uuid_2])
+            instance_uuid_1, instance_uuid_2 = [instance['task_id'] for instance in instances]
         resp = util.query_jobs_via_rawscheduler_endpoint(self.cook_url, instance=[instance_uuid_1, instance_uuid_2])
         instance_uuids = [i['task_id'] for j in resp.json() for i in j['instances']]
         self.assertEqual(200, resp.status_code, msg=resp.content)
@@ -1926,9 +1949,8 @@ class CookTest(util.CookTest):
         self.assertEqual(resp.status_code, 201, resp.content)
         pools, _ = util.all_pools(self.cook_url)
         try:
-            user = util.get_user(self.cook_url, job_uuids[0])
             # Don't query until both of the jobs start
-            util.wait_for_jobs(self.cook_url, job_uuids, 'running')
+            user = util.wait_for_jobs(self.cook_url, job_uuids, 'running')[0]['user']
             resp = util.user_current_usage(self.cook_url, user=user, group_breakdown='true')
             self.assertEqual(resp.status_code, 200, resp.content)
             usage_data = resp.json()
@@ -1957,7 +1979,7 @@ class CookTest(util.CookTest):
             # (with possible rounding errors for floating-point cpu/mem values)
             breakdowns_total = Counter(usage_data['ungrouped']['usage'])
             for grouping in usage_data['grouped']:
-                breakdowns_total += Counter(grouping['usage'])
+                breakdowns_total.update(grouping['usage'])
             self.assertAlmostEqual(usage_data['total_usage']['mem'],
                                    breakdowns_total['mem'],
                                    places=4, msg=usage_data)
@@ -2020,9 +2042,8 @@ class CookTest(util.CookTest):
 
         pools, _ = util.all_pools(self.cook_url)
         try:
-            user = util.get_user(self.cook_url, job_uuids[0])
             # Don't query until both of the jobs start
-            util.wait_for_jobs(self.cook_url, job_uuids, 'running')
+            user = util.wait_for_jobs(self.cook_url, job_uuids, 'running')[0]['user']
             resp = util.user_current_usage(self.cook_url, user=user, group_breakdown='true')
             self.assertEqual(resp.status_code, 200, resp.content)
             usage_data = resp.json()
@@ -2051,6 +2072,7 @@ class CookTest(util.CookTest):
 
     def test_user_limits_change(self):
         user = 'limit_change_test_user'
+        reason = self.current_name()
         # set user quota
         resp = util.set_limit(self.cook_url, 'quota', user, cpus=20)
         self.assertEqual(resp.status_code, 201, resp.text)
@@ -2058,7 +2080,7 @@ class CookTest(util.CookTest):
         resp = util.set_limit(self.cook_url, 'quota', user, cpus=10, reason=None)
         self.assertEqual(resp.status_code, 400, resp.text)
         # reset user quota back to default
-        resp = util.reset_limit(self.cook_url, 'quota', user, reason=self.current_name())
+        resp = util.reset_limit(self.cook_url, 'quota', user, reason=reason)
         self.assertEqual(resp.status_code, 204, resp.text)
         # reset user quota fails (malformed) if no reason is given
         resp = util.reset_limit(self.cook_url, 'quota', user, reason=None)
@@ -2070,7 +2092,7 @@ class CookTest(util.CookTest):
         resp = util.set_limit(self.cook_url, 'share', user, cpus=10, reason=None)
         self.assertEqual(resp.status_code, 400, resp.text)
         # reset user share back to default
-        resp = util.reset_limit(self.cook_url, 'share', user, reason=self.current_name())
+        resp = util.reset_limit(self.cook_url, 'share', user, reason=reason)
         self.assertEqual(resp.status_code, 204, resp.text)
         # reset user share fails (malformed) if no reason is given
         resp = util.reset_limit(self.cook_url, 'share', user, reason=None)
@@ -2078,12 +2100,60 @@ class CookTest(util.CookTest):
 
         default_pool = util.default_pool(self.cook_url)
         if default_pool is not None:
+            pools, _ = util.all_pools(self.cook_url)
+            non_default_pools = [p['name'] for p in pools if p['name'] != default_pool]
+
+            def check_pool_limit(limit, pool):
+                # Get the default cpus limit
+                resp = util.get_limit(self.cook_url, limit, "default", pool=pool)
+                self.assertEqual(200, resp.status_code, resp.text)
+                default_limit = resp.json()
+                self.logger.info(f'The default limit in the {pool} pool is {default_limit}')
+                default_cpus = default_limit['cpus']
+
+                # delete the pool's limit
+                resp = util.reset_limit(self.cook_url, limit, user, pool=pool, reason=reason)
+                self.assertEqual(resp.status_code, 204, resp.text)
+
+                # check that the default value is returned
+                resp = util.get_limit(self.cook_url, limit, user, pool=pool)
+                self.assertEqual(resp.status_code, 200, resp.text)
+                self.assertEqual(default_cpus, resp.json()['cpus'], resp.text)
+
+                # set a pool-specific limit
+                resp = util.set_limit(self.cook_url, limit, user, cpus=1000, pool=pool)
+                self.assertEqual(resp.status_code, 201, resp.text)
+
+                # check that the pool-specific limit is returned
+                resp = util.get_limit(self.cook_url, limit, user, pool=pool)
+                self.assertEqual(resp.status_code, 200, resp.text)
+                self.assertEqual(1000, resp.json()['cpus'], resp.text)
+
+                # now delete the pool limit with headers
+                resp = util.reset_limit(self.cook_url, limit, user, reason=reason,
+                                        headers={'x-cook-pool': pool})
+                self.assertEqual(resp.status_code, 204, resp.text)
+
+                # check that the default value is returned
+                resp = util.get_limit(self.cook_url, limit, user, headers={'x-cook-pool': pool})
+                self.assertEqual(resp.status_code, 200, resp.text)
+                self.assertEqual(default_cpus, resp.json()['cpus'], resp.text)
+
+                # set a pool-specific limit
+                resp = util.set_limit(self.cook_url, limit, user, cpus=1000, headers={'x-cook-pool': pool})
+                self.assertEqual(resp.status_code, 201, resp.text)
+
+                # check that the pool-specific limit is returned
+                resp = util.get_limit(self.cook_url, limit, user, headers={'x-cook-pool': pool})
+                self.assertEqual(resp.status_code, 200, resp.text)
+
             for limit in ['quota', 'share']:
                 # Get the default cpus limit
                 resp = util.get_limit(self.cook_url, limit, "default")
                 self.assertEqual(200, resp.status_code, resp.text)
-                self.logger.info(f'The default limit in the {default_pool} pool is {resp.json()}')
-                default_cpus = resp.json()['cpus']
+                default_limit = resp.json()
+                self.logger.info(f'The default limit in the {default_pool} pool is {default_limit}')
+                default_cpus = default_limit['cpus']
 
                 # Set a limit for the default pool
                 resp = util.set_limit(self.cook_url, limit, user, cpus=100, pool=default_pool)
@@ -2100,7 +2170,7 @@ class CookTest(util.CookTest):
                 self.assertEqual(100, resp.json()['cpus'], resp.text)
 
                 # Delete the default pool limit (no pool argument)
-                resp = util.reset_limit(self.cook_url, limit, user, reason=self.current_name())
+                resp = util.reset_limit(self.cook_url, limit, user, reason=reason)
                 self.assertEqual(resp.status_code, 204, resp.text)
 
                 # Check that the default is returned for the default pool
@@ -2108,51 +2178,10 @@ class CookTest(util.CookTest):
                 self.assertEqual(resp.status_code, 200, resp.text)
                 self.assertEqual(default_cpus, resp.json()['cpus'], resp.text)
 
-                pools, _ = util.all_pools(self.cook_url)
-                non_default_pools = [p['name'] for p in pools if p['name'] != default_pool]
-
-                for pool in non_default_pools:
-                    # Get the default cpus limit
-                    resp = util.get_limit(self.cook_url, limit, "default", pool=pool)
-                    self.assertEqual(200, resp.status_code, resp.text)
-                    self.logger.info(f'The default limit in the {default_pool} pool is {resp.json()}')
-                    default_cpus = resp.json()['cpus']
-
-                    # delete the pool's limit
-                    resp = util.reset_limit(self.cook_url, limit, user, pool=pool, reason=self.current_name())
-                    self.assertEqual(resp.status_code, 204, resp.text)
-
-                    # check that the default value is returned
-                    resp = util.get_limit(self.cook_url, limit, user, pool=pool)
-                    self.assertEqual(resp.status_code, 200, resp.text)
-                    self.assertEqual(default_cpus, resp.json()['cpus'], resp.text)
-
-                    # set a pool-specific limit
-                    resp = util.set_limit(self.cook_url, limit, user, cpus=1000, pool=pool)
-                    self.assertEqual(resp.status_code, 201, resp.text)
-
-                    # check that the pool-specific limit is returned
-                    resp = util.get_limit(self.cook_url, limit, user, pool=pool)
-                    self.assertEqual(resp.status_code, 200, resp.text)
-                    self.assertEqual(1000, resp.json()['cpus'], resp.text)
-
-                    # now delete the pool limit with headers
-                    resp = util.reset_limit(self.cook_url, limit, user, reason=self.current_name(),
-                                            headers={'x-cook-pool': pool})
-                    self.assertEqual(resp.status_code, 204, resp.text)
-
-                    # check that the default value is returned
-                    resp = util.get_limit(self.cook_url, limit, user, headers={'x-cook-pool': pool})
-                    self.assertEqual(resp.status_code, 200, resp.text)
-                    self.assertEqual(default_cpus, resp.json()['cpus'], resp.text)
-
-                    # set a pool-specific limit
-                    resp = util.set_limit(self.cook_url, limit, user, cpus=1000, headers={'x-cook-pool': pool})
-                    self.assertEqual(resp.status_code, 201, resp.text)
-
-                    # check that the pool-specific limit is returned
-                    resp = util.get_limit(self.cook_url, limit, user, headers={'x-cook-pool': pool})
-                    self.assertEqual(resp.status_code, 200, resp.text)
+                # Each pool's limits are independent of the others', so check the pools concurrently
+                if non_default_pools:
+                    with ThreadPoolExecutor(max_workers=len(non_default_pools)) as executor:
+                        list(executor.map(lambda pool: check_pool_limit(limit, pool), non_default_pools))
 
     def test_submit_with_no_name(self):
         # We need to manually set the 'uuid' to avoid having the
@@ -2178,15 +2207,12 @@ class CookTest(util.CookTest):
 
     def test_instance_stats_running(self):
         name = str(uuid.uuid4())
-        job_uuid_1, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
+        job_spec = {'command': 'sleep 300', 'name': name, 'max_retries': 2}
+        job_uuids, resp = util.submit_jobs(self.cook_url, job_spec, clones=3)
         self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_2, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_3, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuids = [job_uuid_1, job_uuid_2, job_uuid_3]
         try:
-            instances = [util.wait_for_running_instance(self.cook_url, j) for j in job_uuids]
+            with ThreadPoolExecutor(max_workers=len(job_uuids)) as executor:
+                instances = list(executor.map(lambda j: util.wait_for_running_instance(self.cook_url, j), job_uuids))
             start_time = min(i['start_time'] for i in instances)
             end_time = max(i['start_time'] for i in instances)
             stats, _ = util.get_instance_stats(self.cook_url,
@@ -2194,30 +2220,37 @@ class CookTest(util.CookTest):
                                                start=util.to_iso(start_time),
                                                end=util.to_iso(end_time + 1),
                                                name=name)
-            user = util.get_user(self.cook_url, job_uuid_1)
+            user = self.determine_user()
             self.assertEqual(3, stats['overall']['count'])
             self.assertEqual(3, stats['by-reason']['']['count'])
             self.assertEqual(3, stats['by-user-and-reason'][user]['']['count'])
         finally:
             util.kill_jobs(self.cook_url, job_uuids)
 
+    def assert_percentiles(self, values, percentiles):
+        """Asserts that the 50th, 75th, 95th, 99th and 100th percentiles of values match the given percentiles"""
+        qs = [50, 75, 95, 99, 100]
+        for q, expected in zip(qs, util.percentile(values, qs)):
+            self.assertEqual(expected, percentiles[str(q)], f'{q}th percentile')
+
     def test_instance_stats_failed(self):
         name = str(uuid.uuid4())
-        job_uuid_1, resp = util.submit_job(self.cook_url, command='exit 1', name=name, cpus=0.1, mem=32)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_2, resp = util.submit_job(self.cook_url, command='sleep 1 && exit 1', name=name, cpus=0.2, mem=64)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_3, resp = util.submit_job(self.cook_url, command='sleep 2 && exit 1', name=name, cpus=0.4, mem=128)
+        job_specs = [{'command': 'exit 1', 'name': name, 'cpus': 0.1, 'mem': 32},
+                     {'command': 'sleep 1 && exit 1', 'name': name, 'cpus': 0.2, 'mem': 64},
+                     {'command': 'sleep 2 && exit 1', 'name': name, 'cpus': 0.4, 'mem': 128}]
+        job_uuids, resp = util.submit_jobs(self.cook_url, job_specs)
         self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuids = [job_uuid_1, job_uuid_2, job_uuid_3]
         try:
             jobs = util.wait_for_jobs(self.cook_url, job_uuids, 'completed')
             instances = []
+            instance_cpus = []
+            instance_mems = []
             non_mea_culpa_instances = []
             for job in jobs:
                 for instance in job['instances']:
-                    instance['parent'] = job
                     instances.append(instance)
+                    instance_cpus.append(job['cpus'])
+                    instance_mems.append(job['mem'])
                     if not instance['reason_mea_culpa']:
                         non_mea_culpa_instances.append(instance)
             start_time = min(i['start_time'] for i in instances)
@@ -2229,7 +2262,7 @@ class CookTest(util.CookTest):
                                                name=name)
             self.logger.info(json.dumps(stats, indent=2))
             self.logger.info(f'Instances: {instances}')
-            user = util.get_user(self.cook_url, job_uuid_1)
+            user = jobs[0]['user']
             stats_overall = stats['overall']
             exited_non_zero = 'Command exited non-zero'
             self.assertEqual(len(instances), stats_overall['count'])
@@ -2239,46 +2272,32 @@ class CookTest(util.CookTest):
             run_time_seconds = stats_overall['run-time-seconds']
             percentiles = run_time_seconds['percentiles']
             self.logger.info(f'Run times: {json.dumps(run_times, indent=2)}')
-            self.assertEqual(util.percentile(run_times, 50), percentiles['50'])
-            self.assertEqual(util.percentile(run_times, 75), percentiles['75'])
-            self.assertEqual(util.percentile(run_times, 95), percentiles['95'])
-            self.assertEqual(util.percentile(run_times, 99), percentiles['99'])
-            self.assertEqual(util.percentile(run_times, 100), percentiles['100'])
+            self.assert_percentiles(run_times, percentiles)
             self.assertAlmostEqual(sum(run_times), run_time_seconds['total'])
-            cpu_times = [((i['end_time'] - i['start_time']) / 1000) * i['parent']['cpus'] for i in instances]
+            cpu_times = [t * r for t, r in zip(run_times, instance_cpus)]
             cpu_seconds = stats_overall['cpu-seconds']
             percentiles = cpu_seconds['percentiles']
             self.logger.info(f'CPU times: {json.dumps(cpu_times, indent=2)}')
-            self.assertEqual(util.percentile(cpu_times, 50), percentiles['50'])
-            self.assertEqual(util.percentile(cpu_times, 75), percentiles['75'])
-            self.assertEqual(util.percentile(cpu_times, 95), percentiles['95'])
-            self.assertEqual(util.percentile(cpu_times, 99), percentiles['99'])
-            self.assertEqual(util.percentile(cpu_times, 100), percentiles['100'])
+            self.assert_percentiles(cpu_times, percentiles)
             self.assertAlmostEqual(sum(cpu_times), cpu_seconds['total'])
-            mem_times = [((i['end_time'] - i['start_time']) / 1000) * i['parent']['mem'] for i in instances]
+            mem_times = [t * r for t, r in zip(run_times, instance_mems)]
             mem_seconds = stats_overall['mem-seconds']
             percentiles = mem_seconds['percentiles']
             self.logger.info(f'Mem times: {json.dumps(mem_times, indent=2)}')
-            self.assertEqual(util.percentile(mem_times, 50), percentiles['50'])
-            self.assertEqual(util.percentile(mem_times, 75), percentiles['75'])
-            self.assertEqual(util.percentile(mem_times, 95), percentiles['95'])
-            self.assertEqual(util.percentile(mem_times, 99), percentiles['99'])
-            self.assertEqual(util.percentile(mem_times, 100), percentiles['100'])
+            self.assert_percentiles(mem_times, percentiles)
             self.assertAlmostEqual(sum(mem_times), mem_seconds['total'])
         finally:
             util.kill_jobs(self.cook_url, job_uuids)
 
     def test_instance_stats_success(self):
         name = str(uuid.uuid4())
-        job_uuid_1, resp = util.submit_job(self.cook_url, command='exit 0', name=name, cpus=0.1, mem=32)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_2, resp = util.submit_job(self.cook_url, command='sleep 1', name=name, cpus=0.2, mem=64)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_3, resp = util.submit_job(self.cook_url, command='sleep 2', name=name, cpus=0.4, mem=128)
+        job_specs = [{'command': 'exit 0', 'name': name, 'cpus': 0.1, 'mem': 32},
+                     {'command': 'sleep 1', 'name': name, 'cpus': 0.2, 'mem': 64},
+                     {'command': 'sleep 2', 'name': name, 'cpus': 0.4, 'mem': 128}]
+        job_uuids, resp = util.submit_jobs(self.cook_url, job_specs)
         self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuids = [job_uuid_1, job_uuid_2, job_uuid_3]
         try:
-            util.wait_for_jobs(self.cook_url, job_uuids, 'completed')
+            jobs = util.wait_for_jobs(self.cook_url, job_uuids, 'completed')
             instances = [util.wait_for_instance(self.cook_url, j) for j in job_uuids]
             try:
                 for instance in instances:
@@ -2290,7 +2309,7 @@ class CookTest(util.CookTest):
                                                    start=util.to_iso(start_time),
                                                    end=util.to_iso(end_time + 1),
                                                    name=name)
-                user = util.get_user(self.cook_url, job_uuid_1)
+                user = jobs[0]['user']
                 stats_overall = stats['overall']
                 self.assertEqual(3, stats_overall['count'])
                 self.assertEqual(3, stats['by-reason']['']['count'])
@@ -2298,29 +2317,17 @@ class CookTest(util.CookTest):
                 run_times = [(i['end_time'] - i['start_time']) / 1000 for i in instances]
                 run_time_seconds = stats_overall['run-time-seconds']
                 percentiles = run_time_seconds['percentiles']
-                self.assertEqual(util.percentile(run_times, 50), percentiles['50'])
-                self.assertEqual(util.percentile(run_times, 75), percentiles['75'])
-                self.assertEqual(util.percentile(run_times, 95), percentiles['95'])
-                self.assertEqual(util.percentile(run_times, 99), percentiles['99'])
-                self.assertEqual(util.percentile(run_times, 100), percentiles['100'])
+                self.assert_percentiles(run_times, percentiles)
                 self.assertAlmostEqual(sum(run_times), run_time_seconds['total'])
-                cpu_times = [((i['end_time'] - i['start_time']) / 1000) * i['parent']['cpus'] for i in instances]
+                cpu_times = [t * i['parent']['cpus'] for t, i in zip(run_times, instances)]
                 cpu_seconds = stats_overall['cpu-seconds']
                 percentiles = cpu_seconds['percentiles']
-                self.assertEqual(util.percentile(cpu_times, 50), percentiles['50'])
-                self.assertEqual(util.percentile(cpu_times, 75), percentiles['75'])
-                self.assertEqual(util.percentile(cpu_times, 95), percentiles['95'])
-                self.assertEqual(util.percentile(cpu_times, 99), percentiles['99'])
-                self.assertEqual(util.percentile(cpu_times, 100), percentiles['100'])
+                self.assert_percentiles(cpu_times, percentiles)
                 self.assertAlmostEqual(sum(cpu_times), cpu_seconds['total'])
-                mem_times = [((i['end_time'] - i['start_time']) / 1000) * i['parent']['mem'] for i in instances]
+                mem_times = [t * i['parent']['mem'] for t, i in zip(run_times, instances)]
                 mem_seconds = stats_overall['mem-seconds']
                 percentiles = mem_seconds['percentiles']
-                self.assertEqual(util.percentile(mem_times, 50), percentiles['50'])
-                self.assertEqual(util.percentile(mem_times, 75), percentiles['75'])
-                self.assertEqual(util.percentile(mem_times, 95), percentiles['95'])
-                self.assertEqual(util.percentile(mem_times, 99), percentiles['99'])
-                self.assertEqual(util.percentile(mem_times, 100), percentiles['100'])
+                self.assert_percentiles(mem_times, percentiles)
                 self.assertAlmostEqual(sum(mem_times), mem_seconds['total'])
             except:
                 for instance in instances:
@@ -2331,15 +2338,12 @@ class CookTest(util.CookTest):
 
     def test_instance_stats_supports_epoch_time_params(self):
         name = str(uuid.uuid4())
-        job_uuid_1, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_2, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
+        job_spec = {'command': 'sleep 300', 'name': name, 'max_retries': 2}
+        job_uuids, resp = util.submit_jobs(self.cook_url, job_spec, clones=3)
         self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuid_3, resp = util.submit_job(self.cook_url, command='sleep 300', name=name, max_retries=2)
-        self.assertEqual(resp.status_code, 201, msg=resp.content)
-        job_uuids = [job_uuid_1, job_uuid_2, job_uuid_3]
         try:
-            instances = [util.wait_for_running_instance(self.cook_url, j) for j in job_uuids]
+            with ThreadPoolExecutor(max_workers=len(job_uuids)) as executor:
+                instances = list(executor.map(lambda j: util.wait_for_running_instance(self.cook_url, j), job_uuids))
             start_time = min(i['start_time'] for i in instances)
             end_time = max(i['start_time'] for i in instances)
             stats, _ = util.get_instance_stats(self.cook_url,
@@ -2347,7 +2351,7 @@ class CookTest(util.CookTest):
                                                start=start_time,
                                                end=end_time + 1,
                                                name=name)
-            user = util.get_user(self.cook_url, job_uuid_1)
+            user = self.determine_user()
             self.assertEqual(3, stats['overall']['count'])
             self.assertEqual(3, stats['by-reason']['']['count'])
             self.assertEqual(3, stats['by-user-and-reason'][user]['']['count'])
@@ -2355,28 +2359,21 @@ class CookTest(util.CookTest):
             util.kill_jobs(self.cook_url, job_uuids)
 
     def test_instance_stats_rejects_invalid_params(self):
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-02-20', end='2018-02-21')
-        self.assertEqual(200, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-02-20')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', end='2018-02-21')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, start='2018-02-20', end='2018-02-21')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='bogus', start='2018-02-20', end='2018-02-21')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-02-20',
-                                          end='2018-02-21', name='foo')
-        self.assertEqual(200, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-02-20',
-                                          end='2018-02-21', name='?')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-01-01', end='2018-02-01')
-        self.assertEqual(200, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-01-01', end='2018-02-02')
-        self.assertEqual(400, resp.status_code)
-        _, resp = util.get_instance_stats(self.cook_url, status='running', start='2018-01-01', end='2017-12-31')
-        self.assertEqual(400, resp.status_code)
+        cases = [(dict(status='running', start='2018-02-20', end='2018-02-21'), 200),
+                 (dict(status='running', start='2018-02-20'), 400),
+                 (dict(status='running', end='2018-02-21'), 400),
+                 (dict(start='2018-02-20', end='2018-02-21'), 400),
+                 (dict(status='bogus', start='2018-02-20', end='2018-02-21'), 400),
+                 (dict(status='running', start='2018-02-20', end='2018-02-21', name='foo'), 200),
+                 (dict(status='running', start='2018-02-20', end='2018-02-21', name='?'), 400),
+                 (dict(status='running', start='2018-01-01', end='2018-02-01'), 200),
+                 (dict(status='running', start='2018-01-01', end='2018-02-02'), 400),
+                 (dict(status='running', start='2018-01-01', end='2017-12-31'), 400)]
+        # None of these queries has side effects, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=len(cases)) as executor:
+            responses = list(executor.map(lambda c: util.get_instance_stats(self.cook_url, **c[0])[1], cases))
+        for (params, expected_status), resp in zip(cases, responses):
+            self.assertEqual(expected_status, resp.status_code, params)
 
     def test_cors_request(self):
         resp = util.session.get(f"{self.cook_url}/settings", headers={"Origin": "http://bad.example.com"})
@@ -2384,11 +2381,7 @@ class CookTest(util.CookTest):
         self.assertEqual(b"Cross origin request denied from http://bad.example.com", resp.content)
 
         def origin_allowed(cors_patterns, origin):
-            return any([re.search(pattern, origin) for pattern in cors_patterns])
-
-        resp = util.session.get(f"{self.cook_url}/settings", headers={"Origin": self.cors_origin})
-        self.assertEqual(200, resp.status_code)
-        self.assertTrue(origin_allowed(resp.json()["cors-origins"], self.cors_origin), resp.json())
+            return any(re.search(pattern, origin) for pattern in cors_patterns)
 
         resp = util.session.get(f"{self.cook_url}/settings", headers={"Origin": self.cors_origin})
         self.assertEqual(200, resp.status_code)
@@ -2436,11 +2429,9 @@ class CookTest(util.CookTest):
         self.assertEqual(resp.status_code, 400, msg=resp.content)
 
     def test_ssl(self):
-        settings = util.settings(self.cook_url)
-        if 'server-https-port' not in settings or settings['server-https-port'] is None:
-            self.logger.info('SSL not configured: skipping test')
-            return
-        ssl_port = settings['server-https-port']
+        ssl_port = util.settings(self.cook_url).get('server-https-port')
+        if ssl_port is None:
+            self.skipTest('SSL not configured')
 
         host = urlparse(self.cook_url).hostname
 
@@ -2453,34 +2444,40 @@ class CookTest(util.CookTest):
         task_constraint_mem = constraints['memory-gb'] * 1024
         user = self.determine_user()
         pools, _ = util.active_pools(self.cook_url)
-        for pool in pools:
-            pool_name = pool['name']
-            self.logger.info(f'Testing quota check for pool {pool_name}')
-            quota = util.get_limit(self.cook_url, 'quota', user, pool_name).json()
-
-            # cpus
-            cpus_over_quota = quota['cpus'] + 0.1
-            if cpus_over_quota > task_constraint_cpus:
-                self.logger.info(f'Unable to check CPU quota on {pool_name} because the quota ({quota["cpus"]}) is '
-                                 f'higher than the task constraint ({task_constraint_cpus})')
-            else:
-                self.assertLessEqual(cpus_over_quota, task_constraint_cpus)
-                job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, cpus=0.1)
-                self.assertEqual(201, resp.status_code, msg=resp.content)
-                job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, cpus=cpus_over_quota)
-                self.assertEqual(422, resp.status_code, msg=resp.content)
-
-            # mem
-            mem_over_quota = quota['mem'] + 1
-            if mem_over_quota > task_constraint_mem:
-                self.logger.info(f'Unable to check mem quota on {pool_name} because the quota ({quota["mem"]}) is '
-                                 f'higher than the task constraint ({task_constraint_mem})')
-            else:
-                self.assertLessEqual(mem_over_quota, task_constraint_mem)
-                job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, mem=32)
-                self.assertEqual(201, resp.status_code, msg=resp.content)
-                job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, mem=mem_over_quota)
-                self.assertEqual(422, resp.status_code, msg=resp.content)
+        job_uuids = []
+        try:
+            for pool in pools:
+                pool_name = pool['name']
+                self.logger.info(f'Testing quota check for pool {pool_name}')
+                quota = util.get_limit(self.cook_url, 'quota', user, pool_name).json()
+
+                # cpus
+                cpus_over_quota = quota['cpus'] + 0.1
+                if cpus_over_quota > task_constraint_cpus:
+                    self.logger.info(f'Unable to check CPU quota on {pool_name} because the quota '
+                                     f'({quota["cpus"]}) is higher than the task constraint ({task_constraint_cpus})')
+                else:
+                    self.assertLessEqual(cpus_over_quota, task_constraint_cpus)
+                    job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, cpus=0.1)
+                    self.assertEqual(201, resp.status_code, msg=resp.content)
+                    job_uuids.append(job_uuid)
+                    _, resp = util.submit_job(self.cook_url, pool=pool_name, cpus=cpus_over_quota)
+                    self.assertEqual(422, resp.status_code, msg=resp.content)
+
+                # mem
+                mem_over_quota = quota['mem'] + 1
+                if mem_over_quota > task_constraint_mem:
+                    self.logger.info(f'Unable to check mem quota on {pool_name} because the quota '
+                                     f'({quota["mem"]}) is higher than the task constraint ({task_constraint_mem})')
+                else:
+                    self.assertLessEqual(mem_over_quota, task_constraint_mem)
+                    job_uuid, resp = util.submit_job(self.cook_url, pool=pool_name, mem=32)
+                    self.assertEqual(201, resp.status_code, msg=resp.content)
+                    job_uuids.append(job_uuid)
+                    _, resp = util.submit_job(self.cook_url, pool=pool_name, mem=mem_over_quota)
+                    self.assertEqual(422, resp.status_code, msg=resp.content)
+        finally:
+            util.kill_jobs(self.cook_url, job_uuids)
 
     def test_decrease_retries_below_attempts(self):
         uuid, resp = util.submit_job(self.cook_url, command='exit 1', max_retries=2)
@@ -2496,8 +2493,9 @@ class CookTest(util.CookTest):
         resp = util.retry_jobs(self.cook_url, job=uuid, assert_response=False, retries=1)
         self.assertEqual(409, resp.status_code, msg=resp.content)
         job = util.load_job(self.cook_url, uuid)
-        self.assertEqual('completed', job['status'], json.dumps(job, indent=2))
-        self.assertEqual(1, len(job['instances']), json.dumps(job, indent=2))
+        msg = util.LazyJson(job, indent=2)
+        self.assertEqual('completed', job['status'], msg)
+        self.assertEqual(1, len(job['instances']), msg)
 
         attempts = 2
         uuid, resp = util.submit_job(self.cook_url, command='sleep 30',
@@ -2535,31 +2533,33 @@ class CookTest(util.CookTest):
         util.kill_jobs(self.cook_url, [uuid])
 
         def instances_complete(job):
-            return all([i['status'] == 'failed' for i in job['instances']])
+            return all(i['status'] == 'failed' for i in job['instances'])
 
         job = util.wait_until(lambda: util.load_job(self.cook_url, uuid), instances_complete)
-        self.assertEqual('completed', job['status'], json.dumps(job, indent=2))
+        msg = util.LazyJson(job, indent=2)
+        self.assertEqual('completed', job['status'], msg)
         num_instances = len(job['instances'])
-        self.assertEqual(5 - num_instances, job['retries_remaining'], json.dumps(job, indent=2))
+        self.assertEqual(5 - num_instances, job['retries_remaining'], msg)
 
         resp = util.retry_jobs(self.cook_url, job=uuid, retries=num_instances, assert_response=False)
         self.assertEqual(409, resp.status_code, msg=resp.content)
         job = util.load_job(self.cook_url, uuid)
         self.assertEqual('completed', job['status'])
-        self.assertEqual(num_instances, len(job['instances']), json.dumps(job, indent=2))
+        self.assertEqual(num_instances, len(job['instances']), util.LazyJson(job, indent=2))
 
     def test_pools_in_default_limit_response(self):
         pools, resp = util.all_pools(self.cook_url)
         pool_names = [p['name'] for p in pools]
 
         user = self.determine_user()
-        for limit in ['share', 'quota']:
+
+        def check_limit(limit):
             resp = util.get_limit(self.cook_url, limit, user)
             self.assertEqual(200, resp.status_code)
+            limit_pools = resp.json()['pools']
+            self.assertEqual(set(), set(pool_names) - limit_pools.keys(), limit_pools)
             for pool in pool_names:
-                self.assertTrue(pool in resp.json()['pools'])
-                for resource in ['cpus', 'gpus', 'mem']:
-                    self.assertTrue(resource in resp.json()['pools'][pool])
+                self.assertLessEqual({'cpus', 'gpus', 'mem'}, limit_pools[pool].keys(), limit_pools[pool])
 
             if len(pool_names) > 0:
                 resp = util.get_limit(self.cook_url, limit, user, pool_names[0])
@@ -2568,6 +2568,11 @@ class CookTest(util.CookTest):
                 resp = util.get_limit(self.cook_url, limit, user)
                 self.assertFalse('pools' in resp.json())
 
+        # The share and quota checks only read limits, so run them concurrently
+        limits = ['share', 'quota']
+        with ThreadPoolExecutor(max_workers=len(limits)) as executor:
+            list(executor.map(check_limit, limits))
+
     def test_submit_plugin(self):
         if not util.demo_plugin_is_configured(self.cook_url):
             self.skipTest("Requires demo plugin to be configured")
@@ -2586,7 +2591,7 @@ class CookTest(util.CookTest):
             self.assertEqual(resp.status_code, 400, msg=resp.content)
             self.assertTrue(b"Message1- Fail to submit" in resp.content, msg=resp.content)
         finally:
-            util.kill_jobs(self.cook_url, [job_uuids], assert_response=False)
+            util.kill_jobs(self.cook_url, job_uuids, assert_response=False)
 
     def test_launch_plugin(self):
         if not util.demo_plugin_is_configured(self.cook_url):
@@ -2601,13 +2606,12 @@ class CookTest(util.CookTest):
             # Validate job is still waiting and unscheduled.
             def query_unscheduled():
                 resp = util.unscheduled_jobs(self.cook_url, job_uuid)[0][0]
-                self.logger.info(f"unscheduled_jobs response: {resp}")
-                return any([r['reason'] == reasons.PLUGIN_IS_BLOCKING
-                            for r in resp['reasons']])
+                self.logger.info('unscheduled_jobs response: %s', resp)
+                return any(r['reason'] == reasons.PLUGIN_IS_BLOCKING for r in resp['reasons'])
 
             util.wait_until(query_unscheduled, lambda r: r, 30000)
             job = util.load_job(self.cook_url, job_uuid)
-            details = f"Job details: {json.dumps(job, sort_keys=True)}"
+            details = util.LazyJson(job, 'Job details: ', sort_keys=True)
             self.assertEquals(job['status'], 'waiting', details)
 
             # Wait a bit and the demo plugin will mark it as launchable.
@@ -2654,7 +2658,7 @@ class CookTest(util.CookTest):
             resp = util.unscheduled_jobs(self.cook_url, job_uuid)[0][0]
             placement_reasons = [reason for reason in resp['reasons']
                                  if reason['reason'] == reasons.COULD_NOT_PLACE_JOB]
-            self.logger.info(f"unscheduled_jobs response: {resp}")
+            self.logger.info('unscheduled_jobs response: %s', resp)
             return placement_reasons
 
         placement_reasons = util.wait_until(query_unscheduled, lambda r: len(r) > 0)
@@ -2675,7 +2679,7 @@ class CookTest(util.CookTest):
             costs = [{'node': target['hostname'], 'cost': 0.1, 'suitable': True}]
             for host in hosts_to_consider[1:]:
                 costs.append({'node': host['hostname'], 'cost': 0.1, 'suitable': False})
-            self.logger.info(f'Updating costs: {costs}')
+            self.logger.info('Updating costs: %s', costs)
             data_local_service = os.getenv('DATA_LOCAL_SERVICE')
             util.session.post(f'{data_local_service}/set-costs', json={str(job_uuid): costs})
             instance = util.wait_for_instance(self.cook_url, job_uuid)
@@ -2692,10 +2696,8 @@ class CookTest(util.CookTest):
         job_uuid, resp = util.submit_job(self.cook_url, datasets=[{'dataset': {'foo': str(uuid.uuid4())}}])
         try:
             self.assertEqual(201, resp.status_code, resp.text)
-            slaves = util.get_mesos_state(self.mesos_url)['slaves']
-            costs = []
-            for slave in slaves:
-                costs.append({'node': slave['hostname'], 'cost': 0.1})
+            hostnames = [slave['hostname'] for slave in util.get_mesos_slaves(self.mesos_url)['slaves']]
+            costs = [{'node': hostname, 'cost': 0.1} for hostname in hostnames]
             data_local_service = os.getenv('DATA_LOCAL_SERVICE')
             util.session.post(f'{data_local_service}/set-costs', json={str(job_uuid): costs})
 
@@ -2709,9 +2711,7 @@ class CookTest(util.CookTest):
 
             cost_resp = util.session.get(f'{self.cook_url}/data-local/{str(job_uuid)}')
             self.assertEqual(200, cost_resp.status_code)
-            expected_costs = {}
-            for slave in slaves:
-                expected_costs[slave['hostname']] = {'cost': 0.1, 'suitable': True}
+            expected_costs = {hostname: {'cost': 0.1, 'suitable': True} for hostname in hostnames}
             self.assertEqual(expected_costs, cost_resp.json())
 
             util.wait_for_jobs(self.cook_url, [job_uuid], 'completed')
@@ -2738,8 +2738,8 @@ class CookTest(util.CookTest):
             self.assertEqual(201, resp.status_code, resp.text)
             instance = util.wait_for_instance(self.cook_url, job_uuid, status='success')
             slave_host = instance['hostname']
-            master_state = util.get_mesos_state(util.retrieve_mesos_url())
-            slave_state = util.session.get(util.get_agent_endpoint(master_state, slave_host)).json()
+            mesos_slaves = util.get_mesos_slaves(util.retrieve_mesos_url())
+            slave_state = util.session.get(util.get_agent_endpoint(mesos_slaves, slave_host)).json()
 
             executor = util.get_executor(slave_state, instance['executor_id'], True)
 
@@ -6,21 +6,30 @@ import logging
 import os
 import os.path
 import subprocess
+import threading
 import time
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.parse import urlencode, urlparse
+from urllib.parse import urlparse
 
 import numpy
 import requests
 from retrying import retry
+from urllib3.util.retry import Retry
 
 from tests.cook import mesos
 
 logger = logging.getLogger(__name__)
 session = importlib.import_module(os.getenv('COOK_SESSION_MODULE', 'requests')).Session()
 session.headers['User-Agent'] = f"Cook-Scheduler-Integration-Tests ({session.headers['User-Agent']})"
+# Keep a larger pool of connections alive across helper calls, and retry requests that fail to connect;
+# we deliberately don't retry on status codes, since some tests assert on 429s and 503s
+__adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                          max_retries=Retry(connect=3, read=0, backoff_factor=0.2))
+session.mount('http://', __adapter)
+session.mount('https://', __adapter)
 
 # default time limit for each individual integration test
 # if a test takes more than 10 minutes, it's probably broken
@@ -33,6 +42,13 @@ DEFAULT_TIMEOUT_MS = int(os.getenv('COOK_TEST_DEFAULT_TIMEOUT_MS', 120000))
 # default wait interval (i.e. time between attempts) used by most wait_* utility functions
 DEFAULT_WAIT_INTERVAL_MS = int(os.getenv('COOK_TEST_DEFAULT_WAIT_INTERVAL_MS', 1000))
 
+# wait_until starts polling at this interval and backs off exponentially up to its wait interval
+INITIAL_WAIT_INTERVAL_MS = int(os.getenv('COOK_TEST_INITIAL_WAIT_INTERVAL_MS', 100))
+
+# Set when the test run is being torn down (e.g. on Ctrl-C), so that wait_until
+# calls still polling in worker threads give up instead of running out their timeouts
+SHUTDOWN = threading.Event()
+
 # Name of our custom HTTP header for user impersonation
 IMPERSONATION_HEADER = 'X-Cook-Impersonate'
 
@@ -284,6 +300,22 @@ def get_in(dct, *keys):
     return dct
 
 
+class LazyJson(object):
+    """
+    Wraps an object so that it is only serialized to JSON (after the given prefix) when
+    converted to a string, e.g. when used as the message of an assertion that fails,
+    rather than up front
+    """
+
+    def __init__(self, obj, prefix='', **kwargs):
+        self.obj = obj
+        self.prefix = prefix
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return f'{self.prefix}{json.dumps(self.obj, **self.kwargs)}'
+
+
 def is_valid_uuid(uuid_to_test, version=4):
     """
     Check if uuid_to_test is a valid UUID.
@@ -301,6 +333,10 @@ def is_valid_uuid(uuid_to_test, version=4):
     >>> is_valid_uuid('c9bf9e58')
     False
     """
+    # Only the canonical, dashed form is accepted, so skip parsing anything of the wrong length
+    if len(uuid_to_test) != 36:
+        return False
+
     try:
         uuid_obj = uuid.UUID(uuid_to_test, version=version)
     except:
@@ -350,6 +386,7 @@ def is_not_blank(in_string):
     return bool(in_string and in_string.strip())
 
 
+@functools.lru_cache()
 def get_job_executor_type(cook_url):
     """Returns 'cook' or 'mesos' based on the default executor Cook is configured with."""
     return 'cook' if is_not_blank(get_in(settings(cook_url), 'executor', 'command')) else 'mesos'
@@ -373,8 +410,11 @@ def init_cook_session(*cook_urls):
         session.auth = UserFactory(None).default().auth
 
 
+@functools.lru_cache()
 def settings(cook_url):
-    return session.get(f'{cook_url}/settings').json()
+    resp = session.get(f'{cook_url}/settings')
+    assert resp.status_code == 200, resp.content
+    return resp.json()
 
 
 @functools.lru_cache()
@@ -463,16 +503,23 @@ def retry_jobs(cook_url, assert_response=True, use_deprecated_post=False, **kwar
 
 
 def kill_jobs(cook_url, jobs, assert_response=True, expected_status_code=204):
-    """Kill one or more jobs"""
+    """Kill one or more jobs, sending the kill requests for separate chunks of jobs concurrently"""
     chunksize = 100
     chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
-    response = []
-    for chunk in chunks:
+
+    def kill_chunk(chunk):
         params = {'job': [unpack_uuid(j) for j in chunk]}
         response = session.delete(f'{cook_url}/rawscheduler', params=params)
         if assert_response:
             assert expected_status_code == response.status_code, response.text
-    return response
+        return response
+
+    if len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+            responses = list(executor.map(kill_chunk, chunks))
+    else:
+        responses = [kill_chunk(chunk) for chunk in chunks]
+    return responses[-1] if responses else []
 
 
 def kill_groups(cook_url, groups, assert_response=True, expected_status_code=204):
@@ -572,6 +619,13 @@ def load_job(cook_url, job_uuid, assert_response=True):
     return load_resource(cook_url, 'jobs', job_uuid, assert_response)
 
 
+def load_jobs(cook_url, job_uuids):
+    """Loads multiple jobs by UUID with a single GET /jobs?uuid=..., returned in the order of job_uuids"""
+    jobs = query_jobs(cook_url, assert_response=True, uuid=job_uuids).json()
+    jobs_by_uuid = {j['uuid']: j for j in jobs}
+    return [jobs_by_uuid[unpack_uuid(u)] for u in job_uuids]
+
+
 def load_instance(cook_url, instance_uuid, assert_response=True):
     """Loads a job instance by UUID using GET /instances/UUID"""
     return load_resource(cook_url, 'instances', instance_uuid, assert_response)
@@ -584,10 +638,28 @@ def wait_until(query, predicate, max_wait_ms=DEFAULT_TIMEOUT_MS, wait_interval_m
     `predicate` is a unary callable that takes the result value of `query`
     and returns True if the condition is met, or False otherwise.
     See `wait_for_job` for an example of using this method.
+    The time between queries starts at INITIAL_WAIT_INTERVAL_MS (plus some
+    jitter) and doubles after each attempt, up to `wait_interval_ms`. The
+    interval is measured from the start of each query, so slow responses
+    don't stretch the time between polls. Polling stops early, re-raising the
+    last failure, once SHUTDOWN is set.
     """
 
-    @retry(stop_max_delay=max_wait_ms, wait_fixed=wait_interval_ms)
+    initial_wait_interval_ms = min(INITIAL_WAIT_INTERVAL_MS, wait_interval_ms)
+    last_query_start = time.monotonic()
+
+    def wait_ms(attempt_number, _):
+        interval_ms = min(initial_wait_interval_ms * 2 ** (attempt_number - 1), wait_interval_ms)
+        elapsed_ms = (time.monotonic() - last_query_start) * 1000
+        return max(interval_ms - elapsed_ms, 0)
+
+    @retry(stop_max_delay=max_wait_ms,
+           wait_func=wait_ms,
+           wait_jitter_max=initial_wait_interval_ms,
+           retry_on_exception=lambda _: not SHUTDOWN.is_set())
     def wait_until_inner():
+        nonlocal last_query_start
+        last_query_start = time.monotonic()
         response = query()
         if not predicate(response):
             error_msg = "wait_until condition not yet met, retrying..."
@@ -600,6 +672,8 @@ def wait_until(query, predicate, max_wait_ms=DEFAULT_TIMEOUT_MS, wait_interval_m
     try:
         return wait_until_inner()
     except:
+        if SHUTDOWN.is_set():
+            raise
         final_response = query()
         try:
             details = final_response.content
@@ -682,7 +756,7 @@ def wait_for_jobs_in_statuses(cook_url, job_ids, statuses, max_wait_ms=DEFAULT_T
         jobs = resp.json()
         for job in jobs:
             logger.info(f"Job {job['uuid']} has status {job['status']}, expecting {statuses}.")
-        return all([job['status'] in statuses for job in jobs])
+        return all(job['status'] in statuses for job in jobs)
 
     response = wait_until(query, predicate, max_wait_ms=max_wait_ms, wait_interval_ms=DEFAULT_WAIT_INTERVAL_MS * 2)
     return response.json()
@@ -715,6 +789,44 @@ def wait_for_exit_code(cook_url, job_id, max_wait_ms=DEFAULT_TIMEOUT_MS):
     return job['instance-with-exit-code']
 
 
+def _sandbox_directory_max_wait_ms(cook_url):
+    """Returns how long to wait for an instance's sandbox_directory field to be synced"""
+    cook_settings = settings(cook_url)
+    cache_ttl_ms = cook_settings['agent-query-cache']['ttl-ms']
+    sync_interval_ms = cook_settings['sandbox-syncer']['sync-interval-ms']
+    return min(4 * max(cache_ttl_ms, sync_interval_ms), 4 * 60 * 1000)
+
+
+def wait_for_instance_fields(cook_url, job_id, fields, max_wait_ms=DEFAULT_TIMEOUT_MS):
+    """
+    Wait for an instance of the given job to have all of the given fields,
+    e.g. both its sandbox_directory and its exit_code, in a single polling loop.
+    Returns that instance on success, and raises an exception if the wait time is exceeded.
+    """
+    job_id = unpack_uuid(job_id)
+    if 'sandbox_directory' in fields:
+        max_wait_ms = max(max_wait_ms, _sandbox_directory_max_wait_ms(cook_url))
+
+    def query():
+        return query_jobs(cook_url, True, uuid=[job_id]).json()[0]
+
+    def predicate(job):
+        if not job['instances']:
+            logger.info(f"Job {job_id} has no instances.")
+        else:
+            for inst in job['instances']:
+                missing_fields = [f for f in fields if f not in inst]
+                if missing_fields:
+                    logger.info(f"Job {job_id} instance {inst['task_id']} is missing {missing_fields}.")
+                else:
+                    logger.info(f"Job {job_id} instance {inst['task_id']} has all of {fields}.")
+                    job['instance-with-fields'] = inst
+                    return True
+
+    job = wait_until(query, predicate, max_wait_ms=max_wait_ms)
+    return job['instance-with-fields']
+
+
 def wait_for_sandbox_directory(cook_url, job_id):
     """
     Wait for the given job's sandbox_directory field to appear.
@@ -722,11 +834,7 @@ def wait_for_sandbox_directory(cook_url, job_id):
     and raises an exception if the max_wait_ms wait time is exceeded.
     """
     job_id = unpack_uuid(job_id)
-
-    cook_settings = settings(cook_url)
-    cache_ttl_ms = cook_settings['agent-query-cache']['ttl-ms']
-    sync_interval_ms = cook_settings['sandbox-syncer']['sync-interval-ms']
-    max_wait_ms = min(4 * max(cache_ttl_ms, sync_interval_ms), 4 * 60 * 1000)
+    max_wait_ms = _sandbox_directory_max_wait_ms(cook_url)
 
     def query():
         response = query_jobs(cook_url, True, uuid=[job_id])
@@ -805,6 +913,14 @@ def get_mesos_state(mesos_url):
     return session.get('%s/state.json' % mesos_url).json()
 
 
+def get_mesos_slaves(mesos_url):
+    """
+    Queries the agents from mesos; the response has the same 'slaves' list as
+    state.json, without the frameworks and tasks that make state.json large
+    """
+    return session.get(f'{mesos_url}/master/slaves').json()
+
+
 def wait_for_output_url(cook_url, job_uuid):
     """
     Wait for the output_url for the given job to be populated,
@@ -835,15 +951,13 @@ def list_jobs(cook_url, **kwargs):
         kwargs['start-ms'] = kwargs.pop('start_ms')
     if 'end_ms' in kwargs:
         kwargs['end-ms'] = kwargs.pop('end_ms')
-    query_params = urlencode(kwargs)
-    resp = session.get('%s/list?%s' % (cook_url, query_params))
+    resp = session.get(f'{cook_url}/list', params=kwargs)
     return resp
 
 
 def jobs(cook_url, headers={}, **kwargs):
     """Makes a request to the /jobs endpoint using the provided kwargs as the query params"""
-    query_params = urlencode(kwargs, doseq=True)
-    resp = session.get('%s/jobs?%s' % (cook_url, query_params), headers=headers)
+    resp = session.get(f'{cook_url}/jobs', params=kwargs, headers=headers)
     return resp
 
 
@@ -852,6 +966,11 @@ def contains_job_uuid(jobs, job_uuid):
     return any(job for job in jobs if job['uuid'] == job_uuid)
 
 
+def job_uuids(jobs):
+    """Returns the set of uuids of the given jobs, for checking the presence of many jobs in one listing"""
+    return {job['uuid'] for job in jobs}
+
+
 def get_executor(agent_state, executor_id, include_completed=False):
     """Returns the executor with id executor_id from agent_state"""
     for framework in agent_state['frameworks']:
@@ -876,7 +995,7 @@ def unscheduled_jobs(cook_url, *job_uuids, partial=None):
     query_params = [('job', u) for u in job_uuids]
     if partial is not None:
         query_params.append(('partial', partial))
-    resp = session.get(f'{cook_url}/unscheduled_jobs?{urlencode(query_params)}')
+    resp = session.get(f'{cook_url}/unscheduled_jobs', params=query_params)
     job_reasons = resp.json() if resp.status_code == 200 else []
     return job_reasons, resp
 
@@ -1076,6 +1195,7 @@ def reset_limit(cook_url, limit_type, user, reason='testing', pool=None, headers
     return session.delete(f'{cook_url}/{limit_type}', params=params, headers=headers)
 
 
+@functools.lru_cache()
 def retrieve_progress_file_env(cook_url):
     """Retrieves the environment variable used by the cook executor to lookup the progress file."""
     cook_settings = settings(cook_url)
@@ -1099,6 +1219,7 @@ def percentile(a, q):
     return numpy.percentile(a, q, interpolation='higher')
 
 
+@functools.lru_cache()
 def default_pool(cook_url):
     """Returns the configured default pool, or None if one is not configured"""
     cook_settings = settings(cook_url)
@@ -1106,9 +1227,14 @@ def default_pool(cook_url):
     return default_pool if default_pool != '' else None
 
 
+@functools.lru_cache()
 def all_pools(cook_url):
-    """Returns the list of all pools that exist"""
+    """
+    Returns the list of all pools that exist. Pools are configured statically, so this is
+    cached; every caller gets the same list and response, which must not be mutated
+    """
     resp = session.get(f'{cook_url}/pools')
+    assert resp.status_code == 200, resp.content
     return resp.json(), resp
 
 
@@ -1118,6 +1244,7 @@ def active_pools(cook_url):
     return [p for p in pools if p['state'] == 'active'], resp
 
 
+@functools.lru_cache()
 def has_ephemeral_hosts():
     """Returns True if the cluster under test has ephemeral hosts"""
     s = os.getenv('COOK_TEST_EPHEMERAL_HOSTS')
@@ -1140,6 +1267,7 @@ def _cook_executor_config():
     return cook_executor_config
 
 
+@functools.lru_cache()
 def is_cook_executor_in_use():
     """Returns true if the cook executor is configured and COOK_TEST_DOCKER_IMAGE is not set"""
     is_cook_executor_configured = is_not_blank(get_in(_cook_executor_config(), 'command'))
@@ -1148,7 +1276,7 @@ def is_cook_executor_in_use():
 
 def slave_cpus(mesos_url, hostname):
     """Returns the cpus of the specified Mesos agent"""
-    slaves = get_mesos_state(mesos_url)['slaves']
+    slaves = get_mesos_slaves(mesos_url)['slaves']
     # Here we need to use unreserved_resources because Mesos might only
     # send offers for the unreserved (role = "*") portions of the agents.
     slave_cpus = next(s['unreserved_resources']['cpus'] for s in slaves if s['hostname'] == hostname)
@@ -1157,14 +1285,14 @@ def slave_cpus(mesos_url, hostname):
 
 def slave_pool(mesos_url, hostname):
     """Returns the pool of the specified Mesos agent, or None if the agent doesn't have the attribute"""
-    slaves = get_mesos_state(mesos_url)['slaves']
+    slaves = get_mesos_slaves(mesos_url)['slaves']
     pool = next(s.get('attributes', {}).get('cook-pool', None) for s in slaves if s['hostname'] == hostname)
     return pool
 
 
 def max_slave_cpus(mesos_url):
     """Returns the max cpus of all current Mesos agents"""
-    slaves = get_mesos_state(mesos_url)['slaves']
+    slaves = get_mesos_slaves(mesos_url)['slaves']
     max_slave_cpus = max([s['resources']['cpus'] for s in slaves])
     return max_slave_cpus
 
@@ -1175,6 +1303,7 @@ def task_constraint_cpus(cook_url):
     return task_constraint_cpus
 
 
+@functools.lru_cache()
 def max_cpus(mesos_url, cook_url):
     """Returns the maximum cpus we can submit that actually fits on a slave"""
     slave_cpus = max_slave_cpus(mesos_url)
@@ -1223,8 +1352,7 @@ def hosts_to_consider(cook_url, mesos_url):
     """
     Returns the hosts in the default pool, or all hosts if the cluster is not using pools
     """
-    state = get_mesos_state(mesos_url)
-    slaves = state['slaves']
+    slaves = get_mesos_slaves(mesos_url)['slaves']
     pool = default_pool(cook_url)
     slaves = [s for s in slaves if s['attributes'].get('cook-pool', None) == pool] if pool else slaves
     num_to_log = min(len(slaves), 10)
@@ -1293,11 +1421,10 @@ def using_data_local_fitness_calculator():
 
 
 def get_agent_endpoint(master_state, agent_hostname):
-    agent = [agent for agent in master_state['slaves']
-             if agent['hostname'] == agent_hostname][0]
+    agent = next((agent for agent in master_state['slaves'] if agent['hostname'] == agent_hostname), None)
     if agent is None:
-        logger.warning(f"Could not find agent for hostname {instance['hostname']}")
-        logger.warning(f"slaves: {state['slaves']}")
+        logger.warning(f"Could not find agent for hostname {agent_hostname}")
+        logger.warning(f"slaves: {master_state['slaves']}")
         return None
     else:
         # Get the host and port of the agent API.
@@ -1310,8 +1437,8 @@ def get_agent_endpoint(master_state, agent_hostname):
 @functools.lru_cache()
 def _supported_isolators():
     mesos_url = retrieve_mesos_url()
-    mesos_state = get_mesos_state(mesos_url)
-    slave_endpoint = get_agent_endpoint(mesos_state, mesos_state['slaves'][0]['hostname'])
+    mesos_slaves = get_mesos_slaves(mesos_url)
+    slave_endpoint = get_agent_endpoint(mesos_slaves, mesos_slaves['slaves'][0]['hostname'])
     slave_state = session.get(slave_endpoint).json()
     if 'flags' in slave_state:
         return set(slave_state['flags']['isolation'].split(','))